@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from typing import List, Union
+from typing import List, Optional, Union
 
 from great_expectations.compatibility import pyspark
 from great_expectations.compatibility.pyspark import functions as F
@@ -14,6 +14,39 @@ from great_expectations.execution_engine.partition_and_sample.data_partitioner i
 
 logger = logging.getLogger(__name__)
 
+# hashlib algorithm names that map onto Spark's built-in sha2() and its digest bit length.
+_NATIVE_SHA2_BIT_LENGTHS = {"sha224": 224, "sha256": 256, "sha384": 384, "sha512": 512}
+
+
+def _hashed_column_suffix(
+    column_name: str, hash_function_name: str, hash_digits: int
+) -> pyspark.Column:
+    """Last hash_digits hex digits of the hashlib digest of each value in column_name.
+
+    Digests that Spark implements natively are computed in the JVM; any other hashlib algorithm
+    falls back to a Python UDF.  Either way the suffix is taken the same way, and, as with
+    hexdigest()[-hash_digits:], a hash_digits of 0 keeps the whole digest.
+    """
+    hashed_value: pyspark.Column
+    if hash_function_name == "md5":
+        hashed_value = F.md5(column_name)
+    elif hash_function_name == "sha1":
+        hashed_value = F.sha1(column_name)
+    elif hash_function_name in _NATIVE_SHA2_BIT_LENGTHS:
+        hashed_value = F.sha2(F.col(column_name), _NATIVE_SHA2_BIT_LENGTHS[hash_function_name])
+    else:
+
+        def _encrypt_value(to_encode):
+            hash_func = getattr(hashlib, hash_function_name)
+            return hash_func(to_encode.encode()).hexdigest()
+
+        hashed_value = F.udf(_encrypt_value, pyspark.types.StringType())(column_name)
+
+    if hash_digits == 0:
+        return hashed_value
+
+    return F.substring(hashed_value, -1 * hash_digits, hash_digits)
+
 
 class SparkDataPartitioner(DataPartitioner):
     """Methods for partitioning data accessible via SparkDFExecutionEngine.
@@ -257,6 +290,8 @@ class SparkDataPartitioner(DataPartitioner):
     @staticmethod
     def partition_on_multi_column_values(df, column_names: list, batch_identifiers: dict):
         """Partition on the joint values in the named columns"""
+        # Combined into one predicate so that a single filtered DataFrame is built and analyzed.
+        condition: Optional[pyspark.Column] = None
         for column_name in column_names:
             value = batch_identifiers.get(column_name)
             if not value:
@@ -265,8 +300,13 @@ class SparkDataPartitioner(DataPartitioner):
                     f"all values in  column_names must also exist in batch_identifiers. "
                     f"{column_name} was not found in batch_identifiers."
                 )
-            df = df.filter(F.col(column_name) == value)
-        return df
+            column_condition = F.col(column_name) == value
+            condition = column_condition if condition is None else condition & column_condition
+
+        if condition is None:
+            return df
+
+        return df.filter(condition)
 
     @staticmethod
     def partition_on_hashed_column(
@@ -287,14 +327,13 @@ class SparkDataPartitioner(DataPartitioner):
                 )
             )
 
-        def _encrypt_value(to_encode):
-            hash_func = getattr(hashlib, hash_function_name)
-            hashed_value = hash_func(to_encode.encode()).hexdigest()[-1 * hash_digits :]
-            return hashed_value
-
-        encrypt_udf = F.udf(_encrypt_value, pyspark.types.StringType())
+        encrypted_value = _hashed_column_suffix(
+            column_name=column_name,
+            hash_function_name=hash_function_name,
+            hash_digits=hash_digits,
+        )
         res = (
-            df.withColumn("encrypted_value", encrypt_udf(column_name))
+            df.withColumn("encrypted_value", encrypted_value)
             .filter(F.col("encrypted_value") == batch_identifiers["hash_value"])
             .drop("encrypted_value")
         )
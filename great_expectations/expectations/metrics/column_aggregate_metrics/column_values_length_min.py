@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.execution_engine import (
@@ -24,7 +26,9 @@ class ColumnValuesLengthMin(ColumnAggregateMetricProvider):
 
     @column_aggregate_value(engine=PandasExecutionEngine, filter_column_isnull=True)  # type: ignore[misc] # untyped-decorator
     def _pandas(cls, column: pd.Series, **kwargs: dict) -> int:
-        return column.map(len).min()
+        # Measuring through a plain iterator over the values avoids building an intermediate Series.
+        lengths = np.fromiter(map(len, column.to_numpy()), dtype=np.int64, count=len(column))
+        return lengths.min() if lengths.size else np.nan
 
     @column_aggregate_partial(  # type: ignore[misc] # untyped-decorator
         engine=SqlAlchemyExecutionEngine, filter_column_isnull=True
@@ -30,15 +30,16 @@ class ColumnValuesDecreasing(ColumnMapMetricProvider):
         column,
         **kwargs,
     ):
-        temp_column = column
-
-        series_diff = temp_column.diff()
-        series_diff[series_diff.isnull()] = -1
+        series_diff = column.diff()
 
         strictly: bool = kwargs.get("strictly") or False
         if strictly:
-            return series_diff < 0
-        return series_diff <= 0
+            in_order = series_diff < 0
+        else:
+            in_order = series_diff <= 0
+        # The first element is null, so it gets a bye and is always treated as True; OR-ing the
+        # null mask in avoids a masked write into the diff.
+        return in_order | series_diff.isnull()
 
     @metric_partial(
         engine=SparkDFExecutionEngine,
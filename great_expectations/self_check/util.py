@@ -950,6 +950,33 @@ def modify_locale(func: Callable[P, None]) -> Callable[P, None]:
     return locale_wrapper
 
 
+def convert_pandas_df_to_spark_rows(df: pd.DataFrame) -> List[tuple]:
+    """Convert a pandas DataFrame into row tuples of native Python values, with NaN as None.
+
+    The conversion is done column by column straight from each column's NumPy array, so float
+    columns are NaN-masked in one pass instead of testing every cell; only object columns need a
+    per-value check.
+    """
+    columns: List[list] = []
+    for _, series in df.items():
+        values: np.ndarray = series.to_numpy()
+        if values.dtype.kind == "f":
+            column: np.ndarray = values.astype(object)
+            column[np.isnan(values)] = None
+            columns.append(column.tolist())
+        elif values.dtype.kind == "O":
+            columns.append(
+                [
+                    None if isinstance(x, (float, int)) and np.isnan(x) else x
+                    for x in values.tolist()
+                ]
+            )
+        else:
+            columns.append(values.tolist())
+
+    return list(zip(*columns))
+
+
 def build_spark_validator_with_data(
     df: Union[pd.DataFrame, pyspark.DataFrame],
     spark: pyspark.SparkSession,
@@ -958,13 +985,7 @@ def build_spark_validator_with_data(
 ) -> Validator:
     if isinstance(df, pd.DataFrame):
         df = spark.createDataFrame(
-            [
-                tuple(
-                    None if isinstance(x, (float, int)) and np.isnan(x) else x
-                    for x in record.tolist()
-                )
-                for record in df.to_records(index=False)
-            ],
+            convert_pandas_df_to_spark_rows(df=df),
             df.columns.tolist(),
         )
 
@@ -1058,13 +1079,7 @@ def build_spark_engine(
 
     if isinstance(df, pd.DataFrame):
         if schema is None:
-            data: Union[pd.DataFrame, List[tuple]] = [
-                tuple(
-                    None if isinstance(x, (float, int)) and np.isnan(x) else x
-                    for x in record.tolist()
-                )
-                for record in df.to_records(index=False)
-            ]
+            data: Union[pd.DataFrame, List[tuple]] = convert_pandas_df_to_spark_rows(df=df)
             schema = df.columns.tolist()  # type: ignore[assignment]
         else:
             data = df
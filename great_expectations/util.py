@@ -415,7 +415,7 @@ def _convert_json_bools_to_python_bools(code: str) -> str:
     return code
 
 
-def filter_properties_dict(  # noqa: C901, PLR0912, PLR0913
+def filter_properties_dict(  # noqa: C901, PLR0913
     properties: Optional[dict] = None,
     keep_fields: Optional[Set[str]] = None,
     delete_fields: Optional[Set[str]] = None,
@@ -468,56 +468,21 @@ def filter_properties_dict(  # noqa: C901, PLR0912, PLR0913
 
     key: str
     value: Any
-
-    if keep_fields:
-        keys_for_deletion.extend(
-            [key for key, value in properties.items() if key not in keep_fields]
-        )
-
-    if delete_fields:
-        keys_for_deletion.extend([key for key, value in properties.items() if key in delete_fields])
-
-    if clean_nulls:
-        keys_for_deletion.extend(
-            [
-                key
-                for key, value in properties.items()
-                if not (
-                    (keep_fields and key in keep_fields)
-                    or (delete_fields and key in delete_fields)
-                    or value is not None
-                )
-            ]
-        )
-
-    if clean_falsy:
-        if keep_falsy_numerics:
-            keys_for_deletion.extend(
-                [
-                    key
-                    for key, value in properties.items()
-                    if not (
-                        (keep_fields and key in keep_fields)
-                        or (delete_fields and key in delete_fields)
-                        or is_truthy(value=value)
-                        or is_numeric(value=value)
-                    )
-                ]
+    for key, value in properties.items():
+        if keep_fields and key in keep_fields:
+            continue
+
+        if (
+            keep_fields
+            or key in delete_fields
+            or (clean_nulls and value is None)
+            or (
+                clean_falsy
+                and not is_truthy(value=value)
+                and not (keep_falsy_numerics and is_numeric(value=value))
             )
-        else:
-            keys_for_deletion.extend(
-                [
-                    key
-                    for key, value in properties.items()
-                    if not (
-                        (keep_fields and key in keep_fields)
-                        or (delete_fields and key in delete_fields)
-                        or is_truthy(value=value)
-                    )
-                ]
-            )
-
-    keys_for_deletion = list(set(keys_for_deletion))
+        ):
+            keys_for_deletion.append(key)
 
     for key in keys_for_deletion:
         del properties[key]
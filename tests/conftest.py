@@ -13,7 +13,6 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Dict, Final, Generator, List, Optional
 from unittest import mock
 
-import numpy as np
 import packaging
 import pandas as pd
 import pytest
@@ -68,6 +67,7 @@ from great_expectations.self_check.util import (
     build_test_backends_list as build_test_backends_list_v3,
 )
 from great_expectations.self_check.util import (
+    convert_pandas_df_to_spark_rows,
     expectationSuiteValidationResultSchema,
 )
 from great_expectations.util import (
@@ -475,25 +475,43 @@ def sa(test_backends):
             raise ValueError("SQL Database tests require sqlalchemy to be installed.")
 
 
-@pytest.mark.order(index=2)
-@pytest.fixture
-def spark_session(test_backends) -> pyspark.SparkSession:
+def _get_or_create_test_spark_session() -> pyspark.SparkSession:
     from great_expectations.compatibility import pyspark
 
     if pyspark.SparkSession:  # type: ignore[truthy-function]
-        return SparkDFExecutionEngine.get_or_create_spark_session()
+        # Test DataFrames are tiny, so Spark's default of 200 shuffle partitions only adds
+        # scheduling overhead to every aggregation; this is a runtime option and needs no restart.
+        return SparkDFExecutionEngine.get_or_create_spark_session(
+            spark_config={"spark.sql.shuffle.partitions": "2"}
+        )
 
     raise ValueError("spark tests are requested, but pyspark is not installed")
 
 
+@pytest.mark.order(index=2)
+@pytest.fixture
+def spark_session(test_backends) -> pyspark.SparkSession:
+    return _get_or_create_test_spark_session()
+
+
+@pytest.mark.order(index=2)
+@pytest.fixture(scope="module")
+def module_spark_session(test_backends) -> pyspark.SparkSession:
+    """Same session as "spark_session", for use by module-scoped Spark fixtures."""
+    return _get_or_create_test_spark_session()
+
+
 @pytest.fixture
 def basic_spark_df_execution_engine(spark_session):
     from great_expectations.execution_engine import SparkDFExecutionEngine
 
     conf: List[tuple] = spark_session.sparkContext.getConf().getAll()
     spark_config: Dict[str, Any] = dict(conf)
+    # spark_config is the session's own configuration, so handing over the session avoids
+    # re-checking every option against the JVM on each construction.
     execution_engine = SparkDFExecutionEngine(
         spark_config=spark_config,
+        spark=spark_session,
     )
     return execution_engine
 
@@ -2019,13 +2037,7 @@ def spark_df_from_pandas_df():
         pandas_df,
     ):
         spark_df = spark_session.createDataFrame(
-            [
-                tuple(
-                    None if isinstance(x, (float, int)) and np.isnan(x) else x
-                    for x in record.tolist()
-                )
-                for record in pandas_df.to_records(index=False)
-            ],
+            convert_pandas_df_to_spark_rows(df=pandas_df),
             pandas_df.columns.tolist(),
         )
         return spark_df
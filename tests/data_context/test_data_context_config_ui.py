@@ -1,6 +1,6 @@
 import copy
 import os
-from typing import Any, Dict, Final, Optional
+from typing import Any, Callable, Dict, Final, Hashable, Optional
 
 import pytest
 
@@ -12,11 +12,11 @@ from great_expectations.data_context.types.base import (
     DatabaseStoreBackendDefaults,
     DataContextConfig,
     DataContextConfigDefaults,
-    DataContextConfigSchema,
     FilesystemStoreBackendDefaults,
     GCSStoreBackendDefaults,
     InMemoryStoreBackendDefaults,
     S3StoreBackendDefaults,
+    dataContextConfigSchema,
 )
 from great_expectations.util import filter_properties_dict
 
@@ -31,8 +31,112 @@ _DEFAULT_CONFIG_VERSION: Final[float] = float(
 )
 
 
-@pytest.fixture(scope="function")
-def construct_data_context_config():
+_DATABASE_CREDENTIALS: Final[Dict[str, str]] = {
+    "drivername": "postgresql",
+    "host": os.getenv("GE_TEST_LOCAL_DB_HOSTNAME", "localhost"),
+    "port": "65432",
+    "username": "ge_tutorials",
+    "password": "ge_tutorials",
+    "database": "ge_tutorials",
+}
+
+
+_DEFAULT_CONFIG_JSON_DICT: Final[Dict[str, Any]] = {
+    "analytics_enabled": None,
+    "data_context_id": None,
+    "checkpoint_store_name": None,
+    "config_variables_file_path": None,
+    "config_version": 4,
+    "data_docs_sites": None,
+    "suite_parameter_store_name": None,
+    "expectations_store_name": None,
+    "fluent_datasources": {},
+    "plugins_directory": None,
+    "progress_bars": None,
+    "stores": DataContextConfigDefaults.DEFAULT_STORES.value,
+    "validation_results_store_name": None,
+}
+
+
+# Stored already filtered, as the dumped config is compared against it directly.
+_IN_MEMORY_DESIRED_CONFIG: Final[Optional[dict]] = filter_properties_dict(
+    properties={
+        "checkpoint_store_name": "checkpoint_store",
+        "config_version": 4.0,
+        "suite_parameter_store_name": "suite_parameter_store",
+        "expectations_store_name": "expectations_store",
+        "stores": {
+            "checkpoint_store": {
+                "class_name": "CheckpointStore",
+                "store_backend": {"class_name": "InMemoryStoreBackend"},
+            },
+            "suite_parameter_store": {"class_name": "SuiteParameterStore"},
+            "expectations_store": {
+                "class_name": "ExpectationsStore",
+                "store_backend": {"class_name": "InMemoryStoreBackend"},
+            },
+            "validation_results_store": {
+                "class_name": "ValidationResultsStore",
+                "store_backend": {"class_name": "InMemoryStoreBackend"},
+            },
+            "validation_definition_store": {
+                "class_name": "ValidationDefinitionStore",
+                "store_backend": {"class_name": "InMemoryStoreBackend"},
+            },
+        },
+        "validation_results_store_name": "validation_results_store",
+    },
+    clean_falsy=True,
+)
+
+
+def _custom_database_credentials(store: str) -> Dict[str, str]:
+    return {
+        key: f"custom_{store}_store_{key}"
+        for key in ("drivername", "host", "port", "username", "password", "database")
+    }
+
+
+def _database_store(
+    class_name: str, credentials: Dict[str, str] = _DATABASE_CREDENTIALS
+) -> Dict[str, Any]:
+    return {
+        "class_name": class_name,
+        "store_backend": {
+            "class_name": "DatabaseStoreBackend",
+            "credentials": credentials,
+        },
+    }
+
+
+def _filtered_dump(data_context_config: DataContextConfig) -> dict:
+    # The freshly dumped dictionary is owned here, so it can be filtered in place.
+    dumped_config: dict = dataContextConfigSchema.dump(data_context_config)
+    filter_properties_dict(properties=dumped_config, clean_falsy=True, inplace=True)
+    return dumped_config
+
+
+def _assert_dumped_config_equals(
+    data_context_config: DataContextConfig, desired_config: Dict[str, Any]
+) -> None:
+    assert _filtered_dump(data_context_config) == filter_properties_dict(
+        properties=desired_config, clean_falsy=True
+    )
+
+
+def _freeze(value: Any) -> Hashable:
+    # Containers are tagged with their type, so that e.g. {"k": v} and [("k", v)] cannot collide.
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((key, _freeze(item)) for key, item in value.items())))
+
+    if isinstance(value, list):
+        return ("list", tuple(_freeze(item) for item in value))
+
+    return value
+
+
+@pytest.fixture(scope="session")
+def construct_data_context_config() -> Callable[..., Dict[str, Any]]:
     """
     Construct a DataContextConfig fixture given the modifications in the input parameters
     Returns:
@@ -40,7 +144,7 @@ def construct_data_context_config():
     """
 
     def _construct_data_context_config(
-        data_context_id: str,
+        data_context_id: Optional[str],
         config_version: float = _DEFAULT_CONFIG_VERSION,
         expectations_store_name: str = DataContextConfigDefaults.DEFAULT_EXPECTATIONS_STORE_NAME.value,  # noqa: E501
         validation_results_store_name: str = DataContextConfigDefaults.DEFAULT_VALIDATIONS_STORE_NAME.value,  # noqa: E501
@@ -50,7 +154,7 @@ def construct_data_context_config():
         plugins_directory: Optional[str] = None,
         stores: Optional[Dict] = None,
         data_docs_sites: Optional[Dict] = None,
-    ):
+    ) -> Dict[str, Any]:
         if stores is None:
             stores = copy.deepcopy(DataContextConfigDefaults.DEFAULT_STORES.value)
         if data_docs_sites is None:
@@ -70,59 +174,23 @@ def construct_data_context_config():
             "data_context_id": data_context_id,
         }
 
-    return _construct_data_context_config
-
-
-@pytest.mark.unit
-def test_DataContextConfig_with_BaseStoreBackendDefaults_and_simple_defaults(
-    construct_data_context_config,
-):
-    """
-    What does this test and why?
-    Ensure that a very simple DataContextConfig setup with many defaults is created accurately
-    and produces a valid DataContextConfig
-    """
-
-    store_backend_defaults = BaseStoreBackendDefaults()
-    data_context_config = DataContextConfig(
-        store_backend_defaults=store_backend_defaults,
-        checkpoint_store_name=store_backend_defaults.checkpoint_store_name,
-    )
-
-    desired_config = construct_data_context_config(
-        data_context_id=data_context_config.data_context_id,
-    )
+    memo: Dict[Hashable, Dict[str, Any]] = {}
 
-    data_context_config_schema = DataContextConfigSchema()
-    assert filter_properties_dict(
-        properties=data_context_config_schema.dump(data_context_config),
-        clean_falsy=True,
-    ) == filter_properties_dict(
-        properties=desired_config,
-        clean_falsy=True,
-    )
-    assert isinstance(
-        SerializableDataContext.get_or_create_data_context_config(
-            project_config=data_context_config
-        ),
-        DataContextConfig,
-    )
+    def _memoized_construct_data_context_config(**kwargs: Any) -> Dict[str, Any]:
+        key: Hashable = _freeze(kwargs)
+        if key not in memo:
+            memo[key] = _construct_data_context_config(**kwargs)
 
+        # Tests may adjust the returned config, so never hand out the memoized instance itself.
+        return copy.deepcopy(memo[key])
 
-@pytest.mark.unit
-def test_DataContextConfig_with_S3StoreBackendDefaults(construct_data_context_config):
-    """
-    What does this test and why?
-    Make sure that using S3StoreBackendDefaults as the store_backend_defaults applies appropriate
-    defaults, including default_bucket_name getting propagated to all stores.
-    """
+    return _memoized_construct_data_context_config
 
-    store_backend_defaults = S3StoreBackendDefaults(default_bucket_name="my_default_bucket")
-    data_context_config = DataContextConfig(
-        store_backend_defaults=store_backend_defaults,
-    )
 
-    # Create desired config
+@pytest.fixture(scope="session")
+def desired_s3_config(
+    construct_data_context_config: Callable[..., Dict[str, Any]],
+) -> Dict[str, Any]:
     desired_stores_config = {
         "suite_parameter_store": {"class_name": "SuiteParameterStore"},
         "expectations_S3_store": {
@@ -173,62 +241,21 @@ def test_DataContextConfig_with_S3StoreBackendDefaults(construct_data_context_co
         }
     }
 
-    desired_config = construct_data_context_config(
-        data_context_id=data_context_config.data_context_id,
+    return construct_data_context_config(
+        data_context_id=None,
         expectations_store_name="expectations_S3_store",
         validation_results_store_name="validation_results_S3_store",
-        suite_parameter_store_name=DataContextConfigDefaults.DEFAULT_SUITE_PARAMETER_STORE_NAME.value,
         checkpoint_store_name="checkpoint_S3_store",
+        suite_parameter_store_name=DataContextConfigDefaults.DEFAULT_SUITE_PARAMETER_STORE_NAME.value,
         stores=desired_stores_config,
         data_docs_sites=desired_data_docs_sites_config,
     )
 
-    data_context_config_schema = DataContextConfigSchema()
-    assert filter_properties_dict(
-        properties=data_context_config_schema.dump(data_context_config),
-        clean_falsy=True,
-    ) == filter_properties_dict(
-        properties=desired_config,
-        clean_falsy=True,
-    )
-    assert isinstance(
-        SerializableDataContext.get_or_create_data_context_config(
-            project_config=data_context_config
-        ),
-        DataContextConfig,
-    )
-
-
-@pytest.mark.unit
-def test_DataContextConfig_with_S3StoreBackendDefaults_using_all_parameters(
-    construct_data_context_config,
-):
-    """
-    What does this test and why?
-    Make sure that S3StoreBackendDefaults parameters are handled appropriately
-    E.g. Make sure that default_bucket_name is ignored if individual bucket names are passed
-    """
 
-    store_backend_defaults = S3StoreBackendDefaults(
-        default_bucket_name="custom_default_bucket_name",
-        expectations_store_bucket_name="custom_expectations_store_bucket_name",
-        validation_results_store_bucket_name="custom_validation_results_store_bucket_name",
-        data_docs_bucket_name="custom_data_docs_store_bucket_name",
-        checkpoint_store_bucket_name="custom_checkpoint_store_bucket_name",
-        expectations_store_prefix="custom_expectations_store_prefix",
-        validation_results_store_prefix="custom_validation_results_store_prefix",
-        data_docs_prefix="custom_data_docs_prefix",
-        checkpoint_store_prefix="custom_checkpoint_store_prefix",
-        expectations_store_name="custom_expectations_S3_store_name",
-        validation_results_store_name="custom_validation_results_S3_store_name",
-        suite_parameter_store_name="custom_suite_parameter_store_name",
-        checkpoint_store_name="custom_checkpoint_S3_store_name",
-    )
-    data_context_config = DataContextConfig(
-        store_backend_defaults=store_backend_defaults,
-    )
-
-    # Create desired config
+@pytest.fixture(scope="session")
+def desired_s3_config_using_all_parameters(
+    construct_data_context_config: Callable[..., Dict[str, Any]],
+) -> Dict[str, Any]:
     desired_stores_config = {
         "custom_suite_parameter_store_name": {"class_name": "SuiteParameterStore"},
         "custom_expectations_S3_store_name": {
@@ -279,8 +306,8 @@ def test_DataContextConfig_with_S3StoreBackendDefaults_using_all_parameters(
         }
     }
 
-    desired_config = construct_data_context_config(
-        data_context_id=data_context_config.data_context_id,
+    return construct_data_context_config(
+        data_context_id=None,
         expectations_store_name="custom_expectations_S3_store_name",
         validation_results_store_name="custom_validation_results_S3_store_name",
         suite_parameter_store_name="custom_suite_parameter_store_name",
@@ -289,131 +316,11 @@ def test_DataContextConfig_with_S3StoreBackendDefaults_using_all_parameters(
         data_docs_sites=desired_data_docs_sites_config,
     )
 
-    data_context_config_schema = DataContextConfigSchema()
-    assert filter_properties_dict(
-        properties=data_context_config_schema.dump(data_context_config),
-        clean_falsy=True,
-    ) == filter_properties_dict(
-        properties=desired_config,
-        clean_falsy=True,
-    )
-    assert isinstance(
-        SerializableDataContext.get_or_create_data_context_config(
-            project_config=data_context_config
-        ),
-        DataContextConfig,
-    )
-
-
-@pytest.mark.unit
-def test_DataContextConfig_with_FilesystemStoreBackendDefaults_and_simple_defaults(
-    construct_data_context_config,
-):
-    """
-    What does this test and why?
-    Ensure that a very simple DataContextConfig setup using FilesystemStoreBackendDefaults is created accurately
-    This test sets the root_dir parameter
-    """  # noqa: E501
-
-    test_root_directory = "test_root_dir"
-
-    store_backend_defaults = FilesystemStoreBackendDefaults(root_directory=test_root_directory)
-    data_context_config = DataContextConfig(
-        store_backend_defaults=store_backend_defaults,
-    )
-
-    # Create desired config
-    data_context_id = data_context_config.data_context_id
-    desired_config = construct_data_context_config(data_context_id=data_context_id)
-    # Add root_directory to stores and data_docs
-    desired_config["stores"][desired_config["expectations_store_name"]]["store_backend"][
-        "root_directory"
-    ] = test_root_directory
-    desired_config["stores"][desired_config["validation_results_store_name"]]["store_backend"][
-        "root_directory"
-    ] = test_root_directory
-    desired_config["stores"][desired_config["checkpoint_store_name"]]["store_backend"][
-        "root_directory"
-    ] = test_root_directory
-    desired_config["data_docs_sites"]["local_site"]["store_backend"]["root_directory"] = (
-        test_root_directory
-    )
-
-    desired_config["stores"]["validation_definition_store"]["store_backend"]["root_directory"] = (
-        test_root_directory
-    )
 
-    data_context_config_schema = DataContextConfigSchema()
-    assert filter_properties_dict(
-        properties=data_context_config_schema.dump(data_context_config),
-        clean_falsy=True,
-    ) == filter_properties_dict(
-        properties=desired_config,
-        clean_falsy=True,
-    )
-    assert isinstance(
-        SerializableDataContext.get_or_create_data_context_config(
-            project_config=data_context_config
-        ),
-        DataContextConfig,
-    )
-
-
-@pytest.mark.unit
-def test_DataContextConfig_with_FilesystemStoreBackendDefaults_and_simple_defaults_no_root_directory(  # noqa: E501
-    construct_data_context_config,
-):
-    """
-    What does this test and why?
-    Ensure that a very simple DataContextConfig setup using FilesystemStoreBackendDefaults is created accurately
-    This test does not set the optional root_directory parameter
-    """  # noqa: E501
-
-    store_backend_defaults = FilesystemStoreBackendDefaults()
-    data_context_config = DataContextConfig(
-        store_backend_defaults=store_backend_defaults,
-        checkpoint_store_name=store_backend_defaults.checkpoint_store_name,
-    )
-
-    # Create desired config
-    data_context_id = data_context_config.data_context_id
-    desired_config = construct_data_context_config(data_context_id=data_context_id)
-
-    data_context_config_schema = DataContextConfigSchema()
-    assert filter_properties_dict(
-        properties=data_context_config_schema.dump(data_context_config),
-        clean_falsy=True,
-    ) == filter_properties_dict(
-        properties=desired_config,
-        clean_falsy=True,
-    )
-    assert isinstance(
-        SerializableDataContext.get_or_create_data_context_config(
-            project_config=data_context_config
-        ),
-        DataContextConfig,
-    )
-
-
-@pytest.mark.unit
-def test_DataContextConfig_with_GCSStoreBackendDefaults(construct_data_context_config):
-    """
-    What does this test and why?
-    Make sure that using GCSStoreBackendDefaults as the store_backend_defaults applies appropriate
-    defaults, including default_bucket_name & default_project_name getting propagated
-    to all stores.
-    """
-
-    store_backend_defaults = GCSStoreBackendDefaults(
-        default_bucket_name="my_default_bucket",
-        default_project_name="my_default_project",
-    )
-    data_context_config = DataContextConfig(
-        store_backend_defaults=store_backend_defaults,
-    )
-
-    # Create desired config
-    data_context_id = data_context_config.data_context_id
+@pytest.fixture(scope="session")
+def desired_gcs_config(
+    construct_data_context_config: Callable[..., Dict[str, Any]],
+) -> Dict[str, Any]:
     desired_stores_config = {
         "suite_parameter_store": {"class_name": "SuiteParameterStore"},
         "expectations_GCS_store": {
@@ -469,8 +376,8 @@ def test_DataContextConfig_with_GCSStoreBackendDefaults(construct_data_context_c
         }
     }
 
-    desired_config = construct_data_context_config(
-        data_context_id=data_context_id,
+    return construct_data_context_config(
+        data_context_id=None,
         expectations_store_name="expectations_GCS_store",
         validation_results_store_name="validation_results_GCS_store",
         checkpoint_store_name="checkpoint_GCS_store",
@@ -479,57 +386,11 @@ def test_DataContextConfig_with_GCSStoreBackendDefaults(construct_data_context_c
         data_docs_sites=desired_data_docs_sites_config,
     )
 
-    data_context_config_schema = DataContextConfigSchema()
-    assert filter_properties_dict(
-        properties=data_context_config_schema.dump(data_context_config),
-        clean_falsy=True,
-    ) == filter_properties_dict(
-        properties=desired_config,
-        clean_falsy=True,
-    )
-    assert isinstance(
-        SerializableDataContext.get_or_create_data_context_config(
-            project_config=data_context_config
-        ),
-        DataContextConfig,
-    )
-
-
-@pytest.mark.unit
-def test_DataContextConfig_with_GCSStoreBackendDefaults_using_all_parameters(
-    construct_data_context_config,
-):
-    """
-    What does this test and why?
-    Make sure that GCSStoreBackendDefaults parameters are handled appropriately
-    E.g. Make sure that default_bucket_name is ignored if individual bucket names are passed
-    """
-
-    store_backend_defaults = GCSStoreBackendDefaults(
-        default_bucket_name="custom_default_bucket_name",
-        default_project_name="custom_default_project_name",
-        expectations_store_bucket_name="custom_expectations_store_bucket_name",
-        validation_results_store_bucket_name="custom_validation_results_store_bucket_name",
-        data_docs_bucket_name="custom_data_docs_store_bucket_name",
-        checkpoint_store_bucket_name="custom_checkpoint_store_bucket_name",
-        expectations_store_project_name="custom_expectations_store_project_name",
-        validation_results_store_project_name="custom_validation_results_store_project_name",
-        data_docs_project_name="custom_data_docs_store_project_name",
-        checkpoint_store_project_name="custom_checkpoint_store_project_name",
-        expectations_store_prefix="custom_expectations_store_prefix",
-        validation_results_store_prefix="custom_validation_results_store_prefix",
-        data_docs_prefix="custom_data_docs_prefix",
-        checkpoint_store_prefix="custom_checkpoint_store_prefix",
-        expectations_store_name="custom_expectations_GCS_store_name",
-        validation_results_store_name="custom_validation_results_GCS_store_name",
-        suite_parameter_store_name="custom_suite_parameter_store_name",
-        checkpoint_store_name="custom_checkpoint_GCS_store_name",
-    )
-    data_context_config = DataContextConfig(
-        store_backend_defaults=store_backend_defaults,
-    )
 
-    # Create desired config
+@pytest.fixture(scope="session")
+def desired_gcs_config_using_all_parameters(
+    construct_data_context_config: Callable[..., Dict[str, Any]],
+) -> Dict[str, Any]:
     desired_stores_config = {
         "custom_suite_parameter_store_name": {"class_name": "SuiteParameterStore"},
         "custom_expectations_GCS_store_name": {
@@ -584,24 +445,321 @@ def test_DataContextConfig_with_GCSStoreBackendDefaults_using_all_parameters(
             },
         }
     }
+    return construct_data_context_config(
+        data_context_id=None,
+        expectations_store_name="custom_expectations_GCS_store_name",
+        validation_results_store_name="custom_validation_results_GCS_store_name",
+        suite_parameter_store_name="custom_suite_parameter_store_name",
+        checkpoint_store_name="custom_checkpoint_GCS_store_name",
+        stores=desired_stores_config,
+        data_docs_sites=desired_data_docs_sites_config,
+    )
+
+
+@pytest.fixture(scope="session")
+def desired_database_config(
+    construct_data_context_config: Callable[..., Dict[str, Any]],
+) -> Dict[str, Any]:
+    desired_stores_config = {
+        "suite_parameter_store": {"class_name": "SuiteParameterStore"},
+        "expectations_database_store": _database_store("ExpectationsStore"),
+        "validation_results_database_store": _database_store("ValidationResultsStore"),
+        "validation_definition_store": _database_store("ValidationDefinitionStore"),
+        "checkpoint_database_store": _database_store("CheckpointStore"),
+    }
+    desired_data_docs_sites_config = {
+        "local_site": {
+            "class_name": "SiteBuilder",
+            "show_how_to_buttons": True,
+            "site_index_builder": {
+                "class_name": "DefaultSiteIndexBuilder",
+            },
+            "store_backend": {
+                "base_directory": "uncommitted/data_docs/local_site/",
+                "class_name": "TupleFilesystemStoreBackend",
+            },
+        }
+    }
+
+    return construct_data_context_config(
+        data_context_id=None,
+        expectations_store_name="expectations_database_store",
+        validation_results_store_name="validation_results_database_store",
+        checkpoint_store_name="checkpoint_database_store",
+        suite_parameter_store_name=DataContextConfigDefaults.DEFAULT_SUITE_PARAMETER_STORE_NAME.value,
+        stores=desired_stores_config,
+        data_docs_sites=desired_data_docs_sites_config,
+    )
+
+
+@pytest.fixture(scope="session")
+def desired_database_config_using_all_parameters(
+    construct_data_context_config: Callable[..., Dict[str, Any]],
+) -> Dict[str, Any]:
+    desired_stores_config = {
+        "custom_suite_parameter_store_name": {"class_name": "SuiteParameterStore"},
+        "custom_expectations_database_store_name": _database_store(
+            "ExpectationsStore", _custom_database_credentials("expectations")
+        ),
+        "custom_validation_results_database_store_name": _database_store(
+            "ValidationResultsStore", _custom_database_credentials("validation_results")
+        ),
+        "validation_definition_store": _database_store("ValidationDefinitionStore"),
+        "custom_checkpoint_database_store_name": _database_store(
+            "CheckpointStore", _custom_database_credentials("checkpoint")
+        ),
+    }
+    desired_data_docs_sites_config = {
+        "local_site": {
+            "class_name": "SiteBuilder",
+            "show_how_to_buttons": True,
+            "site_index_builder": {
+                "class_name": "DefaultSiteIndexBuilder",
+            },
+            "store_backend": {
+                "base_directory": "uncommitted/data_docs/local_site/",
+                "class_name": "TupleFilesystemStoreBackend",
+            },
+        }
+    }
+
+    return construct_data_context_config(
+        data_context_id=None,
+        expectations_store_name="custom_expectations_database_store_name",
+        validation_results_store_name="custom_validation_results_database_store_name",
+        suite_parameter_store_name="custom_suite_parameter_store_name",
+        checkpoint_store_name="custom_checkpoint_database_store_name",
+        stores=desired_stores_config,
+        data_docs_sites=desired_data_docs_sites_config,
+    )
+
+
+@pytest.mark.unit
+def test_DataContextConfig_with_BaseStoreBackendDefaults_and_simple_defaults(
+    construct_data_context_config,
+):
+    """
+    What does this test and why?
+    Ensure that a very simple DataContextConfig setup with many defaults is created accurately
+    and produces a valid DataContextConfig
+    """
+
+    store_backend_defaults = BaseStoreBackendDefaults()
+    data_context_config = DataContextConfig(
+        store_backend_defaults=store_backend_defaults,
+        checkpoint_store_name=store_backend_defaults.checkpoint_store_name,
+    )
+
     desired_config = construct_data_context_config(
         data_context_id=data_context_config.data_context_id,
+    )
+
+    _assert_dumped_config_equals(data_context_config, desired_config)
+    assert isinstance(
+        SerializableDataContext.get_or_create_data_context_config(
+            project_config=data_context_config
+        ),
+        DataContextConfig,
+    )
+
+
+@pytest.mark.unit
+def test_DataContextConfig_with_S3StoreBackendDefaults(desired_s3_config):
+    """
+    What does this test and why?
+    Make sure that using S3StoreBackendDefaults as the store_backend_defaults applies appropriate
+    defaults, including default_bucket_name getting propagated to all stores.
+    """
+
+    store_backend_defaults = S3StoreBackendDefaults(default_bucket_name="my_default_bucket")
+    data_context_config = DataContextConfig(
+        store_backend_defaults=store_backend_defaults,
+    )
+
+    _assert_dumped_config_equals(data_context_config, desired_s3_config)
+    assert isinstance(
+        SerializableDataContext.get_or_create_data_context_config(
+            project_config=data_context_config
+        ),
+        DataContextConfig,
+    )
+
+
+@pytest.mark.unit
+def test_DataContextConfig_with_S3StoreBackendDefaults_using_all_parameters(
+    desired_s3_config_using_all_parameters,
+):
+    """
+    What does this test and why?
+    Make sure that S3StoreBackendDefaults parameters are handled appropriately
+    E.g. Make sure that default_bucket_name is ignored if individual bucket names are passed
+    """
+
+    store_backend_defaults = S3StoreBackendDefaults(
+        default_bucket_name="custom_default_bucket_name",
+        expectations_store_bucket_name="custom_expectations_store_bucket_name",
+        validation_results_store_bucket_name="custom_validation_results_store_bucket_name",
+        data_docs_bucket_name="custom_data_docs_store_bucket_name",
+        checkpoint_store_bucket_name="custom_checkpoint_store_bucket_name",
+        expectations_store_prefix="custom_expectations_store_prefix",
+        validation_results_store_prefix="custom_validation_results_store_prefix",
+        data_docs_prefix="custom_data_docs_prefix",
+        checkpoint_store_prefix="custom_checkpoint_store_prefix",
+        expectations_store_name="custom_expectations_S3_store_name",
+        validation_results_store_name="custom_validation_results_S3_store_name",
+        suite_parameter_store_name="custom_suite_parameter_store_name",
+        checkpoint_store_name="custom_checkpoint_S3_store_name",
+    )
+    data_context_config = DataContextConfig(
+        store_backend_defaults=store_backend_defaults,
+    )
+
+    _assert_dumped_config_equals(data_context_config, desired_s3_config_using_all_parameters)
+    assert isinstance(
+        SerializableDataContext.get_or_create_data_context_config(
+            project_config=data_context_config
+        ),
+        DataContextConfig,
+    )
+
+
+@pytest.mark.unit
+def test_DataContextConfig_with_FilesystemStoreBackendDefaults_and_simple_defaults(
+    construct_data_context_config,
+):
+    """
+    What does this test and why?
+    Ensure that a very simple DataContextConfig setup using FilesystemStoreBackendDefaults is created accurately
+    This test sets the root_dir parameter
+    """  # noqa: E501
+
+    test_root_directory = "test_root_dir"
+
+    store_backend_defaults = FilesystemStoreBackendDefaults(root_directory=test_root_directory)
+    data_context_config = DataContextConfig(
+        store_backend_defaults=store_backend_defaults,
+    )
+
+    # Create desired config
+    data_context_id = data_context_config.data_context_id
+    desired_config = construct_data_context_config(data_context_id=data_context_id)
+    # Add root_directory to stores and data_docs
+    desired_config["stores"][desired_config["expectations_store_name"]]["store_backend"][
+        "root_directory"
+    ] = test_root_directory
+    desired_config["stores"][desired_config["validation_results_store_name"]]["store_backend"][
+        "root_directory"
+    ] = test_root_directory
+    desired_config["stores"][desired_config["checkpoint_store_name"]]["store_backend"][
+        "root_directory"
+    ] = test_root_directory
+    desired_config["data_docs_sites"]["local_site"]["store_backend"]["root_directory"] = (
+        test_root_directory
+    )
+
+    desired_config["stores"]["validation_definition_store"]["store_backend"]["root_directory"] = (
+        test_root_directory
+    )
+
+    _assert_dumped_config_equals(data_context_config, desired_config)
+    assert isinstance(
+        SerializableDataContext.get_or_create_data_context_config(
+            project_config=data_context_config
+        ),
+        DataContextConfig,
+    )
+
+
+@pytest.mark.unit
+def test_DataContextConfig_with_FilesystemStoreBackendDefaults_and_simple_defaults_no_root_directory(  # noqa: E501
+    construct_data_context_config,
+):
+    """
+    What does this test and why?
+    Ensure that a very simple DataContextConfig setup using FilesystemStoreBackendDefaults is created accurately
+    This test does not set the optional root_directory parameter
+    """  # noqa: E501
+
+    store_backend_defaults = FilesystemStoreBackendDefaults()
+    data_context_config = DataContextConfig(
+        store_backend_defaults=store_backend_defaults,
+        checkpoint_store_name=store_backend_defaults.checkpoint_store_name,
+    )
+
+    # Create desired config
+    data_context_id = data_context_config.data_context_id
+    desired_config = construct_data_context_config(data_context_id=data_context_id)
+
+    _assert_dumped_config_equals(data_context_config, desired_config)
+    assert isinstance(
+        SerializableDataContext.get_or_create_data_context_config(
+            project_config=data_context_config
+        ),
+        DataContextConfig,
+    )
+
+
+@pytest.mark.unit
+def test_DataContextConfig_with_GCSStoreBackendDefaults(desired_gcs_config):
+    """
+    What does this test and why?
+    Make sure that using GCSStoreBackendDefaults as the store_backend_defaults applies appropriate
+    defaults, including default_bucket_name & default_project_name getting propagated
+    to all stores.
+    """
+
+    store_backend_defaults = GCSStoreBackendDefaults(
+        default_bucket_name="my_default_bucket",
+        default_project_name="my_default_project",
+    )
+    data_context_config = DataContextConfig(
+        store_backend_defaults=store_backend_defaults,
+    )
+
+    _assert_dumped_config_equals(data_context_config, desired_gcs_config)
+    assert isinstance(
+        SerializableDataContext.get_or_create_data_context_config(
+            project_config=data_context_config
+        ),
+        DataContextConfig,
+    )
+
+
+@pytest.mark.unit
+def test_DataContextConfig_with_GCSStoreBackendDefaults_using_all_parameters(
+    desired_gcs_config_using_all_parameters,
+):
+    """
+    What does this test and why?
+    Make sure that GCSStoreBackendDefaults parameters are handled appropriately
+    E.g. Make sure that default_bucket_name is ignored if individual bucket names are passed
+    """
+
+    store_backend_defaults = GCSStoreBackendDefaults(
+        default_bucket_name="custom_default_bucket_name",
+        default_project_name="custom_default_project_name",
+        expectations_store_bucket_name="custom_expectations_store_bucket_name",
+        validation_results_store_bucket_name="custom_validation_results_store_bucket_name",
+        data_docs_bucket_name="custom_data_docs_store_bucket_name",
+        checkpoint_store_bucket_name="custom_checkpoint_store_bucket_name",
+        expectations_store_project_name="custom_expectations_store_project_name",
+        validation_results_store_project_name="custom_validation_results_store_project_name",
+        data_docs_project_name="custom_data_docs_store_project_name",
+        checkpoint_store_project_name="custom_checkpoint_store_project_name",
+        expectations_store_prefix="custom_expectations_store_prefix",
+        validation_results_store_prefix="custom_validation_results_store_prefix",
+        data_docs_prefix="custom_data_docs_prefix",
+        checkpoint_store_prefix="custom_checkpoint_store_prefix",
         expectations_store_name="custom_expectations_GCS_store_name",
         validation_results_store_name="custom_validation_results_GCS_store_name",
         suite_parameter_store_name="custom_suite_parameter_store_name",
         checkpoint_store_name="custom_checkpoint_GCS_store_name",
-        stores=desired_stores_config,
-        data_docs_sites=desired_data_docs_sites_config,
     )
-
-    data_context_config_schema = DataContextConfigSchema()
-    assert filter_properties_dict(
-        properties=data_context_config_schema.dump(data_context_config),
-        clean_falsy=True,
-    ) == filter_properties_dict(
-        properties=desired_config,
-        clean_falsy=True,
+    data_context_config = DataContextConfig(
+        store_backend_defaults=store_backend_defaults,
     )
+
+    _assert_dumped_config_equals(data_context_config, desired_gcs_config_using_all_parameters)
     assert isinstance(
         SerializableDataContext.get_or_create_data_context_config(
             project_config=data_context_config
@@ -611,7 +769,7 @@ def test_DataContextConfig_with_GCSStoreBackendDefaults_using_all_parameters(
 
 
 @pytest.mark.unit
-def test_DataContextConfig_with_DatabaseStoreBackendDefaults(construct_data_context_config):
+def test_DataContextConfig_with_DatabaseStoreBackendDefaults(desired_database_config):
     """
     What does this test and why?
     Make sure that using DatabaseStoreBackendDefaults as the store_backend_defaults applies appropriate
@@ -619,111 +777,13 @@ def test_DataContextConfig_with_DatabaseStoreBackendDefaults(construct_data_cont
     """  # noqa: E501
 
     store_backend_defaults = DatabaseStoreBackendDefaults(
-        default_credentials={
-            "drivername": "postgresql",
-            "host": os.getenv("GE_TEST_LOCAL_DB_HOSTNAME", "localhost"),
-            "port": "65432",
-            "username": "ge_tutorials",
-            "password": "ge_tutorials",
-            "database": "ge_tutorials",
-        },
+        default_credentials=_DATABASE_CREDENTIALS,
     )
     data_context_config = DataContextConfig(
         store_backend_defaults=store_backend_defaults,
     )
 
-    # Create desired config
-    desired_stores_config = {
-        "suite_parameter_store": {"class_name": "SuiteParameterStore"},
-        "expectations_database_store": {
-            "class_name": "ExpectationsStore",
-            "store_backend": {
-                "class_name": "DatabaseStoreBackend",
-                "credentials": {
-                    "drivername": "postgresql",
-                    "host": os.getenv("GE_TEST_LOCAL_DB_HOSTNAME", "localhost"),
-                    "port": "65432",
-                    "username": "ge_tutorials",
-                    "password": "ge_tutorials",
-                    "database": "ge_tutorials",
-                },
-            },
-        },
-        "validation_results_database_store": {
-            "class_name": "ValidationResultsStore",
-            "store_backend": {
-                "class_name": "DatabaseStoreBackend",
-                "credentials": {
-                    "drivername": "postgresql",
-                    "host": os.getenv("GE_TEST_LOCAL_DB_HOSTNAME", "localhost"),
-                    "port": "65432",
-                    "username": "ge_tutorials",
-                    "password": "ge_tutorials",
-                    "database": "ge_tutorials",
-                },
-            },
-        },
-        "validation_definition_store": {
-            "class_name": "ValidationDefinitionStore",
-            "store_backend": {
-                "class_name": "DatabaseStoreBackend",
-                "credentials": {
-                    "database": "ge_tutorials",
-                    "drivername": "postgresql",
-                    "host": "localhost",
-                    "password": "ge_tutorials",
-                    "port": "65432",
-                    "username": "ge_tutorials",
-                },
-            },
-        },
-        "checkpoint_database_store": {
-            "class_name": "CheckpointStore",
-            "store_backend": {
-                "class_name": "DatabaseStoreBackend",
-                "credentials": {
-                    "drivername": "postgresql",
-                    "host": os.getenv("GE_TEST_LOCAL_DB_HOSTNAME", "localhost"),
-                    "port": "65432",
-                    "username": "ge_tutorials",
-                    "password": "ge_tutorials",
-                    "database": "ge_tutorials",
-                },
-            },
-        },
-    }
-    desired_data_docs_sites_config = {
-        "local_site": {
-            "class_name": "SiteBuilder",
-            "show_how_to_buttons": True,
-            "site_index_builder": {
-                "class_name": "DefaultSiteIndexBuilder",
-            },
-            "store_backend": {
-                "base_directory": "uncommitted/data_docs/local_site/",
-                "class_name": "TupleFilesystemStoreBackend",
-            },
-        }
-    }
-
-    desired_config = construct_data_context_config(
-        data_context_id=data_context_config.data_context_id,
-        expectations_store_name="expectations_database_store",
-        validation_results_store_name="validation_results_database_store",
-        checkpoint_store_name="checkpoint_database_store",
-        suite_parameter_store_name=DataContextConfigDefaults.DEFAULT_SUITE_PARAMETER_STORE_NAME.value,
-        stores=desired_stores_config,
-        data_docs_sites=desired_data_docs_sites_config,
-    )
-
-    data_context_config_schema = DataContextConfigSchema()
-    assert filter_properties_dict(
-        properties=data_context_config_schema.dump(data_context_config),
-        clean_falsy=True,
-    ) == filter_properties_dict(
-        properties=desired_config,
-        clean_falsy=True,
-    )
+    _assert_dumped_config_equals(data_context_config, desired_database_config)
     assert isinstance(
         SerializableDataContext.get_or_create_data_context_config(
             project_config=data_context_config
@@ -734,7 +794,7 @@ def test_DataContextConfig_with_DatabaseStoreBackendDefaults(construct_data_cont
 
 @pytest.mark.unit
 def test_DataContextConfig_with_DatabaseStoreBackendDefaults_using_all_parameters(
-    construct_data_context_config,
+    desired_database_config_using_all_parameters,
 ):
     """
     What does this test and why?
@@ -743,38 +803,10 @@ def test_DataContextConfig_with_DatabaseStoreBackendDefaults_using_all_parameter
     """
 
     store_backend_defaults = DatabaseStoreBackendDefaults(
-        default_credentials={
-            "drivername": "postgresql",
-            "host": os.getenv("GE_TEST_LOCAL_DB_HOSTNAME", "localhost"),
-            "port": "65432",
-            "username": "ge_tutorials",
-            "password": "ge_tutorials",
-            "database": "ge_tutorials",
-        },
-        expectations_store_credentials={
-            "drivername": "custom_expectations_store_drivername",
-            "host": "custom_expectations_store_host",
-            "port": "custom_expectations_store_port",
-            "username": "custom_expectations_store_username",
-            "password": "custom_expectations_store_password",
-            "database": "custom_expectations_store_database",
-        },
-        validation_results_store_credentials={
-            "drivername": "custom_validation_results_store_drivername",
-            "host": "custom_validation_results_store_host",
-            "port": "custom_validation_results_store_port",
-            "username": "custom_validation_results_store_username",
-            "password": "custom_validation_results_store_password",
-            "database": "custom_validation_results_store_database",
-        },
-        checkpoint_store_credentials={
-            "drivername": "custom_checkpoint_store_drivername",
-            "host": "custom_checkpoint_store_host",
-            "port": "custom_checkpoint_store_port",
-            "username": "custom_checkpoint_store_username",
-            "password": "custom_checkpoint_store_password",
-            "database": "custom_checkpoint_store_database",
-        },
+        default_credentials=_DATABASE_CREDENTIALS,
+        expectations_store_credentials=_custom_database_credentials("expectations"),
+        validation_results_store_credentials=_custom_database_credentials("validation_results"),
+        checkpoint_store_credentials=_custom_database_credentials("checkpoint"),
         expectations_store_name="custom_expectations_database_store_name",
         validation_results_store_name="custom_validation_results_database_store_name",
         suite_parameter_store_name="custom_suite_parameter_store_name",
@@ -784,98 +816,7 @@ def test_DataContextConfig_with_DatabaseStoreBackendDefaults_using_all_parameter
         store_backend_defaults=store_backend_defaults,
     )
 
-    # Create desired config
-    desired_stores_config = {
-        "custom_suite_parameter_store_name": {"class_name": "SuiteParameterStore"},
-        "custom_expectations_database_store_name": {
-            "class_name": "ExpectationsStore",
-            "store_backend": {
-                "class_name": "DatabaseStoreBackend",
-                "credentials": {
-                    "database": "custom_expectations_store_database",
-                    "drivername": "custom_expectations_store_drivername",
-                    "host": "custom_expectations_store_host",
-                    "password": "custom_expectations_store_password",
-                    "port": "custom_expectations_store_port",
-                    "username": "custom_expectations_store_username",
-                },
-            },
-        },
-        "custom_validation_results_database_store_name": {
-            "class_name": "ValidationResultsStore",
-            "store_backend": {
-                "class_name": "DatabaseStoreBackend",
-                "credentials": {
-                    "database": "custom_validation_results_store_database",
-                    "drivername": "custom_validation_results_store_drivername",
-                    "host": "custom_validation_results_store_host",
-                    "password": "custom_validation_results_store_password",
-                    "port": "custom_validation_results_store_port",
-                    "username": "custom_validation_results_store_username",
-                },
-            },
-        },
-        "validation_definition_store": {
-            "class_name": "ValidationDefinitionStore",
-            "store_backend": {
-                "class_name": "DatabaseStoreBackend",
-                "credentials": {
-                    "database": "ge_tutorials",
-                    "drivername": "postgresql",
-                    "host": "localhost",
-                    "password": "ge_tutorials",
-                    "port": "65432",
-                    "username": "ge_tutorials",
-                },
-            },
-        },
-        "custom_checkpoint_database_store_name": {
-            "class_name": "CheckpointStore",
-            "store_backend": {
-                "class_name": "DatabaseStoreBackend",
-                "credentials": {
-                    "database": "custom_checkpoint_store_database",
-                    "drivername": "custom_checkpoint_store_drivername",
-                    "host": "custom_checkpoint_store_host",
-                    "password": "custom_checkpoint_store_password",
-                    "port": "custom_checkpoint_store_port",
-                    "username": "custom_checkpoint_store_username",
-                },
-            },
-        },
-    }
-    desired_data_docs_sites_config = {
-        "local_site": {
-            "class_name": "SiteBuilder",
-            "show_how_to_buttons": True,
-            "site_index_builder": {
-                "class_name": "DefaultSiteIndexBuilder",
-            },
-            "store_backend": {
-                "base_directory": "uncommitted/data_docs/local_site/",
-                "class_name": "TupleFilesystemStoreBackend",
-            },
-        }
-    }
-
-    desired_config = construct_data_context_config(
-        data_context_id=data_context_config.data_context_id,
-        expectations_store_name="custom_expectations_database_store_name",
-        validation_results_store_name="custom_validation_results_database_store_name",
-        suite_parameter_store_name="custom_suite_parameter_store_name",
-        checkpoint_store_name="custom_checkpoint_database_store_name",
-        stores=desired_stores_config,
-        data_docs_sites=desired_data_docs_sites_config,
-    )
-
-    data_context_config_schema = DataContextConfigSchema()
-    assert filter_properties_dict(
-        properties=data_context_config_schema.dump(data_context_config),
-        clean_falsy=True,
-    ) == filter_properties_dict(
-        properties=desired_config,
-        clean_falsy=True,
-    )
+    _assert_dumped_config_equals(data_context_config, desired_database_config_using_all_parameters)
     assert isinstance(
         SerializableDataContext.get_or_create_data_context_config(
             project_config=data_context_config
@@ -1053,14 +994,7 @@ def test_override_general_defaults(
     )
     desired_config["config_variables_file_path"] = "custom_config_variables_file_path"
 
-    data_context_config_schema = DataContextConfigSchema()
-    assert filter_properties_dict(
-        properties=data_context_config_schema.dump(data_context_config),
-        clean_falsy=True,
-    ) == filter_properties_dict(
-        properties=desired_config,
-        clean_falsy=True,
-    )
+    _assert_dumped_config_equals(data_context_config, desired_config)
     assert isinstance(
         SerializableDataContext.get_or_create_data_context_config(
             project_config=data_context_config
@@ -1072,13 +1006,16 @@ def test_override_general_defaults(
 @pytest.mark.big
 @pytest.mark.slow  # 1.81s
 def test_DataContextConfig_with_S3StoreBackendDefaults_and_simple_defaults_with_variable_sub(
-    monkeypatch, construct_data_context_config
+    monkeypatch,
 ):
     """
     What does this test and why?
-    Ensure that a very simple DataContextConfig setup with many defaults is created accurately
-    and produces a valid DataContextConfig
-    """
+    Ensure that a very simple DataContextConfig setup with many defaults produces a valid
+    DataContextConfig when config variables are substituted.
+
+    The serialized config itself is checked by the (unit) test_DataContextConfig_with_S3StoreBackendDefaults;
+    only the instantiation that performs substitution is exercised here.
+    """  # noqa: E501
 
     monkeypatch.setenv("SUBSTITUTED_BASE_DIRECTORY", "../data/")
 
@@ -1087,76 +1024,6 @@ def test_DataContextConfig_with_S3StoreBackendDefaults_and_simple_defaults_with_
         store_backend_defaults=store_backend_defaults,
     )
 
-    # Create desired config
-    desired_stores_config = {
-        "suite_parameter_store": {"class_name": "SuiteParameterStore"},
-        "expectations_S3_store": {
-            "class_name": "ExpectationsStore",
-            "store_backend": {
-                "bucket": "my_default_bucket",
-                "class_name": "TupleS3StoreBackend",
-                "prefix": "expectations",
-            },
-        },
-        "validation_results_S3_store": {
-            "class_name": "ValidationResultsStore",
-            "store_backend": {
-                "bucket": "my_default_bucket",
-                "class_name": "TupleS3StoreBackend",
-                "prefix": "validations",
-            },
-        },
-        "validation_definition_store": {
-            "class_name": "ValidationDefinitionStore",
-            "store_backend": {
-                "bucket": "my_default_bucket",
-                "class_name": "TupleS3StoreBackend",
-                "prefix": "validation_definitions",
-            },
-        },
-        "checkpoint_S3_store": {
-            "class_name": "CheckpointStore",
-            "store_backend": {
-                "bucket": "my_default_bucket",
-                "class_name": "TupleS3StoreBackend",
-                "prefix": "checkpoints",
-            },
-        },
-    }
-    desired_data_docs_sites_config = {
-        "s3_site": {
-            "class_name": "SiteBuilder",
-            "show_how_to_buttons": True,
-            "site_index_builder": {
-                "class_name": "DefaultSiteIndexBuilder",
-            },
-            "store_backend": {
-                "bucket": "my_default_bucket",
-                "class_name": "TupleS3StoreBackend",
-                "prefix": "data_docs",
-            },
-        }
-    }
-
-    desired_config = construct_data_context_config(
-        data_context_id=data_context_config.data_context_id,
-        expectations_store_name="expectations_S3_store",
-        validation_results_store_name="validation_results_S3_store",
-        checkpoint_store_name="checkpoint_S3_store",
-        suite_parameter_store_name=DataContextConfigDefaults.DEFAULT_SUITE_PARAMETER_STORE_NAME.value,
-        stores=desired_stores_config,
-        data_docs_sites=desired_data_docs_sites_config,
-    )
-
-    data_context_config_schema = DataContextConfigSchema()
-    dumped_schema: Any = data_context_config_schema.dump(data_context_config)
-    assert filter_properties_dict(
-        properties=dumped_schema,
-        clean_falsy=True,
-    ) == filter_properties_dict(
-        properties=desired_config,
-        clean_falsy=True,
-    )
     assert isinstance(
         SerializableDataContext.get_or_create_data_context_config(
             project_config=data_context_config
@@ -1166,50 +1033,13 @@ def test_DataContextConfig_with_S3StoreBackendDefaults_and_simple_defaults_with_
 
 
 @pytest.mark.unit
-def test_DataContextConfig_with_InMemoryStoreBackendDefaults(
-    construct_data_context_config,
-):
+def test_DataContextConfig_with_InMemoryStoreBackendDefaults():
     store_backend_defaults = InMemoryStoreBackendDefaults()
     data_context_config = DataContextConfig(
         store_backend_defaults=store_backend_defaults,
     )
 
-    desired_config = {
-        "data_context_id": data_context_config.data_context_id,
-        "checkpoint_store_name": "checkpoint_store",
-        "config_version": 4.0,
-        "suite_parameter_store_name": "suite_parameter_store",
-        "expectations_store_name": "expectations_store",
-        "stores": {
-            "checkpoint_store": {
-                "class_name": "CheckpointStore",
-                "store_backend": {"class_name": "InMemoryStoreBackend"},
-            },
-            "suite_parameter_store": {"class_name": "SuiteParameterStore"},
-            "expectations_store": {
-                "class_name": "ExpectationsStore",
-                "store_backend": {"class_name": "InMemoryStoreBackend"},
-            },
-            "validation_results_store": {
-                "class_name": "ValidationResultsStore",
-                "store_backend": {"class_name": "InMemoryStoreBackend"},
-            },
-            "validation_definition_store": {
-                "class_name": "ValidationDefinitionStore",
-                "store_backend": {"class_name": "InMemoryStoreBackend"},
-            },
-        },
-        "validation_results_store_name": "validation_results_store",
-    }
-
-    data_context_config_schema = DataContextConfigSchema()
-    assert filter_properties_dict(
-        properties=data_context_config_schema.dump(data_context_config),
-        clean_falsy=True,
-    ) == filter_properties_dict(
-        properties=desired_config,
-        clean_falsy=True,
-    )
+    assert _filtered_dump(data_context_config) == _IN_MEMORY_DESIRED_CONFIG
     assert isinstance(
         SerializableDataContext.get_or_create_data_context_config(
             project_config=data_context_config
@@ -1221,18 +1051,4 @@ def test_DataContextConfig_with_InMemoryStoreBackendDefaults(
 @pytest.mark.unit
 def test_data_context_config_defaults():
     config = DataContextConfig()
-    assert config.to_json_dict() == {
-        "analytics_enabled": None,
-        "data_context_id": None,
-        "checkpoint_store_name": None,
-        "config_variables_file_path": None,
-        "config_version": 4,
-        "data_docs_sites": None,
-        "suite_parameter_store_name": None,
-        "expectations_store_name": None,
-        "fluent_datasources": {},
-        "plugins_directory": None,
-        "progress_bars": None,
-        "stores": DataContextConfigDefaults.DEFAULT_STORES.value,
-        "validation_results_store_name": None,
-    }
+    assert config.to_json_dict() == _DEFAULT_CONFIG_JSON_DICT
@@ -14,7 +14,7 @@ from great_expectations.data_context.data_context.file_data_context import (
 )
 from great_expectations.data_context.types.base import (
     DataContextConfig,
-    DataContextConfigSchema,
+    dataContextConfigSchema,
 )
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.exceptions import InvalidConfigError, MissingConfigVariableError
@@ -22,8 +22,6 @@ from tests.data_context.conftest import create_data_context_files
 
 yaml = YAMLHandler()
 
-dataContextConfigSchema = DataContextConfigSchema()
-
 
 @pytest.fixture
 def empty_data_context_with_config_variables(monkeypatch, empty_data_context):
@@ -27,8 +27,12 @@ def test_expectation_suite_identifier_to_tuple():
 @pytest.mark.unit
 @freeze_time("09/26/2019 13:42:41")
 def test_ValidationResultIdentifier_to_tuple(expectation_suite_identifier):
+    # Built inside the test so that run_time comes from the frozen clock.
+    run_id = RunIdentifier("my_run_id")
+    no_run_id = RunIdentifier(None)
+
     validation_result_identifier = ValidationResultIdentifier(
-        expectation_suite_identifier, RunIdentifier("my_run_id"), "my_batch_identifier"
+        expectation_suite_identifier, run_id, "my_batch_identifier"
     )
     assert validation_result_identifier.to_tuple() == (
         "my",
@@ -47,7 +51,7 @@ def test_ValidationResultIdentifier_to_tuple(expectation_suite_identifier):
     )
 
     validation_result_identifier_no_run_id = ValidationResultIdentifier(
-        expectation_suite_identifier, RunIdentifier(None), "my_batch_identifier"
+        expectation_suite_identifier, no_run_id, "my_batch_identifier"
     )
     assert validation_result_identifier_no_run_id.to_tuple() == (
         "my",
@@ -66,7 +70,7 @@ def test_ValidationResultIdentifier_to_tuple(expectation_suite_identifier):
     )
 
     validation_result_identifier_no_batch_identifier = ValidationResultIdentifier(
-        expectation_suite_identifier, RunIdentifier("my_run_id"), None
+        expectation_suite_identifier, run_id, None
     )
     assert validation_result_identifier_no_batch_identifier.to_tuple() == (
         "my",
@@ -85,7 +89,7 @@ def test_ValidationResultIdentifier_to_tuple(expectation_suite_identifier):
     )
 
     validation_result_identifier_no_run_id_no_batch_identifier = ValidationResultIdentifier(
-        expectation_suite_identifier, RunIdentifier(None), None
+        expectation_suite_identifier, no_run_id, None
     )
     assert validation_result_identifier_no_run_id_no_batch_identifier.to_tuple() == (
         "my",
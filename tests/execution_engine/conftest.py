@@ -1,8 +1,10 @@
+from __future__ import annotations
+
 import datetime
 import os
 import random
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 import pandas as pd
 import pytest
@@ -130,8 +132,11 @@ def gcs_batch_spec() -> GCSBatchSpec:
     return batch_spec
 
 
-@pytest.fixture
-def test_sparkdf(spark_session) -> pyspark.DataFrame:
+@pytest.fixture(scope="module")
+def test_sparkdf(module_spark_session: pyspark.SparkSession) -> Iterator[pyspark.DataFrame]:
+    # Built once per module and only ever read by tests.
+    spark_session: pyspark.SparkSession = module_spark_session
+
     def generate_ascending_list_of_datetimes(
         n, start_date=datetime.date(2020, 1, 1), end_date=datetime.date(2020, 12, 31)
     ) -> List[datetime.datetime]:
@@ -176,7 +181,7 @@ def test_sparkdf(spark_session) -> pyspark.DataFrame:
                 "session_ids": session_ids,
                 "event_type": [random.choice(["start", "stop", "continue"]) for i in range(k)],
                 "favorite_color": [
-                    "#" + "".join([random.choice(list("0123456789ABCDEF")) for j in range(6)])
+                    "#" + "".join(random.choice("0123456789ABCDEF") for j in range(6))
                     for i in range(k)
                 ],
             }
@@ -186,7 +191,11 @@ def test_sparkdf(spark_session) -> pyspark.DataFrame:
         "timestamp",
         F.col("timestamp").cast(pyspark.types.IntegerType()).cast(pyspark.types.StringType()),
     )
-    return spark_df
+    spark_df = spark_df.cache()
+    yield spark_df
+    # Release the cached blocks when the module is done so that they do not linger in the shared
+    # session for the rest of the run; non-blocking, since teardown does not need to wait on it.
+    spark_df.unpersist(blocking=False)
 
 
 @pytest.fixture
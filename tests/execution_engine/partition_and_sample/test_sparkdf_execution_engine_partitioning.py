@@ -1,9 +1,9 @@
 import datetime
+import hashlib
 import os
 from typing import List, Tuple
 from unittest import mock
 
-import numpy as np
 import pandas as pd
 import pytest
 
@@ -23,6 +23,7 @@ from great_expectations.execution_engine.partition_and_sample.data_partitioner i
 from great_expectations.execution_engine.partition_and_sample.sparkdf_data_partitioner import (
     SparkDataPartitioner,
 )
+from great_expectations.self_check.util import convert_pandas_df_to_spark_rows
 from tests.execution_engine.partition_and_sample.partition_and_sample_test_cases import (
     MULTIPLE_DATE_PART_BATCH_IDENTIFIERS,
     MULTIPLE_DATE_PART_DATE_PARTS,
@@ -361,13 +362,7 @@ def test_get_batch_with_partition_on_whole_table_s3(spark_session, basic_spark_d
         def mocked_reader_function(*args, **kwargs):
             pd_df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
             df = spark_session.createDataFrame(
-                [
-                    tuple(
-                        None if isinstance(x, (float, int)) and np.isnan(x) else x
-                        for x in record.tolist()
-                    )
-                    for record in pd_df.to_records(index=False)
-                ],
+                convert_pandas_df_to_spark_rows(df=pd_df),
                 pd_df.columns.tolist(),
             )
             return df
@@ -398,13 +393,7 @@ def test_get_batch_with_partition_on_whole_table_azure(
         def mocked_reader_function(*args, **kwargs):
             pd_df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
             df = spark_session.createDataFrame(
-                [
-                    tuple(
-                        None if isinstance(x, (float, int)) and np.isnan(x) else x
-                        for x in record.tolist()
-                    )
-                    for record in pd_df.to_records(index=False)
-                ],
+                convert_pandas_df_to_spark_rows(df=pd_df),
                 pd_df.columns.tolist(),
             )
             return df
@@ -435,13 +424,7 @@ def test_get_batch_with_partition_on_whole_table_gcs(
         def mocked_reader_function(*args, **kwargs):
             pd_df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
             df = spark_session.createDataFrame(
-                [
-                    tuple(
-                        None if isinstance(x, (float, int)) and np.isnan(x) else x
-                        for x in record.tolist()
-                    )
-                    for record in pd_df.to_records(index=False)
-                ],
+                convert_pandas_df_to_spark_rows(df=pd_df),
                 pd_df.columns.tolist(),
             )
             return df
@@ -463,121 +446,102 @@ def test_get_batch_with_partition_on_whole_table_gcs(
     assert len(test_sparkdf.columns) == 2
 
 
-def test_get_batch_with_partition_on_column_value(test_sparkdf, basic_spark_df_execution_engine):
-    partitioned_df = basic_spark_df_execution_engine.get_batch_data(
-        RuntimeDataBatchSpec(
-            batch_data=test_sparkdf,
-            partitioner_method="_partition_on_column_value",
-            partitioner_kwargs={
-                "column_name": "batch_id",
-                "batch_identifiers": {"batch_id": 2},
+@pytest.mark.parametrize(
+    "partitioner_method,partitioner_kwargs,expected_row_count,row_condition",
+    [
+        pytest.param(
+            "_partition_on_column_value",
+            {"column_name": "batch_id", "batch_identifiers": {"batch_id": 2}},
+            12,
+            "batch_id = 2",
+            id="column_value",
+        ),
+        pytest.param(
+            "_partition_on_column_value",
+            {"column_name": "date", "batch_identifiers": {"date": datetime.date(2020, 1, 30)}},
+            3,
+            "date = DATE'2020-01-30'",
+            id="column_value_date",
+        ),
+        pytest.param(
+            "_partition_on_converted_datetime",
+            {"column_name": "timestamp", "batch_identifiers": {"timestamp": "2020-01-03"}},
+            2,
+            "date = DATE'2020-01-03'",
+            id="converted_datetime",
+        ),
+        pytest.param(
+            "_partition_on_divided_integer",
+            {"column_name": "id", "divisor": 10, "batch_identifiers": {"id": 5}},
+            10,
+            "id BETWEEN 50 AND 59",
+            id="divided_integer",
+        ),
+        pytest.param(
+            "_partition_on_mod_integer",
+            {"column_name": "id", "mod": 10, "batch_identifiers": {"id": 5}},
+            12,
+            "id % 10 = 5",
+            id="mod_integer",
+        ),
+        pytest.param(
+            "_partition_on_multi_column_values",
+            {
+                "column_names": ["y", "m", "d"],
+                "batch_identifiers": {"y": 2020, "m": 1, "d": 5},
             },
-        )
-    ).dataframe
-    assert test_sparkdf.count() == 120
-    assert len(test_sparkdf.columns) == 10
-    collected = partitioned_df.collect()
-    for val in collected:
-        assert val.batch_id == 2
-
-    partitioned_df = basic_spark_df_execution_engine.get_batch_data(
-        RuntimeDataBatchSpec(
-            batch_data=test_sparkdf,
-            partitioner_method="_partition_on_column_value",
-            partitioner_kwargs={
-                "column_name": "date",
-                "batch_identifiers": {"date": datetime.date(2020, 1, 30)},
+            4,
+            "date = DATE'2020-01-05'",
+            id="multi_column_values",
+        ),
+        pytest.param(
+            "_partition_on_hashed_column",
+            {
+                "column_name": "favorite_color",
+                "hash_digits": 1,
+                "hash_function_name": "sha256",
+                "batch_identifiers": {"hash_value": "a"},
             },
-        )
-    ).dataframe
-    assert partitioned_df.count() == 3
-    assert len(partitioned_df.columns) == 10
-
-
-def test_get_batch_with_partition_on_converted_datetime(
-    test_sparkdf, basic_spark_df_execution_engine
+            8,
+            "sha2(favorite_color, 256) LIKE '%a'",
+            id="hashed_column",
+        ),
+    ],
+)
+def test_get_batch_with_partition_on_test_sparkdf(
+    test_sparkdf,
+    basic_spark_df_execution_engine,
+    partitioner_method: str,
+    partitioner_kwargs: dict,
+    expected_row_count: int,
+    row_condition: str,
 ):
-    partitioned_df = basic_spark_df_execution_engine.get_batch_data(
-        RuntimeDataBatchSpec(
-            batch_data=test_sparkdf,
-            partitioner_method="_partition_on_converted_datetime",
-            partitioner_kwargs={
-                "column_name": "timestamp",
-                "batch_identifiers": {"timestamp": "2020-01-03"},
-            },
-        )
-    ).dataframe
-    assert partitioned_df.count() == 2
-    assert len(partitioned_df.columns) == 10
-
+    """Every row of the partition satisfies row_condition, and the partition has the expected size.
 
-def test_get_batch_with_partition_on_divided_integer(test_sparkdf, basic_spark_df_execution_engine):
+    Row ids are unique, so for the integer partitioners the count together with the condition pins
+    down exactly which ids were returned.
+    """
     partitioned_df = basic_spark_df_execution_engine.get_batch_data(
         RuntimeDataBatchSpec(
             batch_data=test_sparkdf,
-            partitioner_method="_partition_on_divided_integer",
-            partitioner_kwargs={
-                "column_name": "id",
-                "divisor": 10,
-                "batch_identifiers": {"id": 5},
-            },
+            partitioner_method=partitioner_method,
+            partitioner_kwargs=partitioner_kwargs,
         )
     ).dataframe
-    assert partitioned_df.count() == 10
     assert len(partitioned_df.columns) == 10
-    max_result = partitioned_df.select([F.max("id")])
-    assert max_result.collect()[0]["max(id)"] == 59
-    min_result = partitioned_df.select([F.min("id")])
-    assert min_result.collect()[0]["min(id)"] == 50
+    # A single Spark job yields both the partition size and whether every row meets the condition.
+    row_counts_by_match = partitioned_df.groupBy(F.expr(row_condition).alias("matches")).count()
+    assert {row["matches"]: row["count"] for row in row_counts_by_match.collect()} == {
+        True: expected_row_count
+    }
 
 
-def test_get_batch_with_partition_on_mod_integer(test_sparkdf, basic_spark_df_execution_engine):
-    partitioned_df = basic_spark_df_execution_engine.get_batch_data(
-        RuntimeDataBatchSpec(
-            batch_data=test_sparkdf,
-            partitioner_method="_partition_on_mod_integer",
-            partitioner_kwargs={
-                "column_name": "id",
-                "mod": 10,
-                "batch_identifiers": {"id": 5},
-            },
-        )
-    ).dataframe
-
-    assert partitioned_df.count() == 12
-    assert len(partitioned_df.columns) == 10
-    max_result = partitioned_df.select([F.max("id")])
-    assert max_result.collect()[0]["max(id)"] == 115
-    min_result = partitioned_df.select([F.min("id")])
-    assert min_result.collect()[0]["min(id)"] == 5
-
-
-def test_get_batch_with_partition_on_multi_column_values(
+def test_get_batch_with_partition_on_multi_column_values_missing_column(
     test_sparkdf, basic_spark_df_execution_engine
 ):
-    partitioned_df = basic_spark_df_execution_engine.get_batch_data(
-        RuntimeDataBatchSpec(
-            batch_data=test_sparkdf,
-            partitioner_method="_partition_on_multi_column_values",
-            partitioner_kwargs={
-                "column_names": ["y", "m", "d"],
-                "batch_identifiers": {
-                    "y": 2020,
-                    "m": 1,
-                    "d": 5,
-                },
-            },
-        )
-    ).dataframe
-    assert partitioned_df.count() == 4
-    assert len(partitioned_df.columns) == 10
-    collected = partitioned_df.collect()
-    for val in collected:
-        assert val.date == datetime.date(2020, 1, 5)
-
     with pytest.raises(ValueError):
         # noinspection PyUnusedLocal
-        partitioned_df = basic_spark_df_execution_engine.get_batch_data(
+        _ = basic_spark_df_execution_engine.get_batch_data(
             RuntimeDataBatchSpec(
                 batch_data=test_sparkdf,
                 partitioner_method="_partition_on_multi_column_values",
@@ -593,6 +557,38 @@ def test_get_batch_with_partition_on_multi_column_values(
         ).dataframe
 
 
+@pytest.mark.parametrize(
+    "hash_function_name",
+    [
+        pytest.param("md5", id="native"),
+        pytest.param("sha3_256", id="udf"),
+    ],
+)
+def test_get_batch_with_partition_on_hashed_column_zero_hash_digits(
+    test_sparkdf,
+    basic_spark_df_execution_engine,
+    hash_function_name: str,
+):
+    """hash_digits=0 matches on the whole digest, whether Spark or the hashlib UDF computes it."""
+    favorite_color: str = test_sparkdf.first()["favorite_color"]
+    hash_value: str = getattr(hashlib, hash_function_name)(favorite_color.encode()).hexdigest()
+    partitioned_df = basic_spark_df_execution_engine.get_batch_data(
+        RuntimeDataBatchSpec(
+            batch_data=test_sparkdf,
+            partitioner_method="_partition_on_hashed_column",
+            partitioner_kwargs={
+                "column_name": "favorite_color",
+                "hash_digits": 0,
+                "hash_function_name": hash_function_name,
+                "batch_identifiers": {"hash_value": hash_value},
+            },
+        )
+    ).dataframe
+    assert [row["favorite_color"] for row in partitioned_df.select("favorite_color").collect()] == [
+        favorite_color
+    ]
+
+
 def test_get_batch_with_partition_on_hashed_column_incorrect_hash_function_name(
     test_sparkdf,
     basic_spark_df_execution_engine,
@@ -613,22 +609,3 @@ def test_get_batch_with_partition_on_hashed_column_incorrect_hash_function_name(
                 },
             )
         ).dataframe
-
-
-def test_get_batch_with_partition_on_hashed_column(test_sparkdf, basic_spark_df_execution_engine):
-    partitioned_df = basic_spark_df_execution_engine.get_batch_data(
-        RuntimeDataBatchSpec(
-            batch_data=test_sparkdf,
-            partitioner_method="_partition_on_hashed_column",
-            partitioner_kwargs={
-                "column_name": "favorite_color",
-                "hash_digits": 1,
-                "hash_function_name": "sha256",
-                "batch_identifiers": {
-                    "hash_value": "a",
-                },
-            },
-        )
-    ).dataframe
-    assert partitioned_df.count() == 8
-    assert len(partitioned_df.columns) == 10
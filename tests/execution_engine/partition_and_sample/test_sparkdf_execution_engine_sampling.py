@@ -131,9 +131,10 @@ def test_sample_using_md5(test_sparkdf, basic_spark_df_execution_engine):
             },
         )
     ).dataframe
-    assert sampled_df.count() == 10
     assert len(sampled_df.columns) == 10
 
-    collected = sampled_df.collect()
-    for val in collected:
-        assert val.date in [datetime.date(2020, 1, 15), datetime.date(2020, 1, 29)]
+    sampled_dates = sampled_df.groupBy("date").count().collect()
+    assert {row["date"]: row["count"] for row in sampled_dates} == {
+        datetime.date(2020, 1, 15): 4,
+        datetime.date(2020, 1, 29): 6,
+    }
@@ -17,7 +17,10 @@ from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
 )
-from great_expectations.self_check.util import build_spark_engine
+from great_expectations.self_check.util import (
+    build_spark_engine,
+    convert_pandas_df_to_spark_rows,
+)
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
 from tests.expectations.test_util import get_table_columns_metric
@@ -479,9 +482,9 @@ def test_get_compute_domain_with_unmeetable_row_condition(
     assert accessor_kwargs == {}
 
 
-def test_basic_setup(spark_session, basic_spark_df_execution_engine, spark_df_from_pandas_df):
-    pd_df = pd.DataFrame({"x": range(10)})
-    df = spark_df_from_pandas_df(spark_session, pd_df)
+def test_basic_setup(spark_session, basic_spark_df_execution_engine):
+    # Generated on the JVM side, so no Python rows are serialized to Spark.
+    df = spark_session.range(10).withColumnRenamed("id", "x")
     batch_data = basic_spark_df_execution_engine.get_batch_data(
         batch_spec=RuntimeDataBatchSpec(
             batch_data=df,
@@ -533,19 +536,13 @@ def test_partition_on_multi_column_values_and_sample_using_random(
     # are encouraged to uncomment it, whenever the "_sample_using_random" feature is the main focus of a given effort.  # noqa: E501
     # assert 2 <= returned_df.count() <= 3
 
-    for val in returned_df.collect():
-        assert val.date == datetime.date(2020, 1, 5)
+    assert returned_df.filter(F.col("date") != datetime.date(2020, 1, 5)).count() == 0
 
 
 def test_add_column_row_condition(spark_session, basic_spark_df_execution_engine):
     df = pd.DataFrame({"foo": [1, 2, 3, 3, None, 2, 3, 4, 5, 6]})
     df = spark_session.createDataFrame(
-        [
-            tuple(
-                None if isinstance(x, (float, int)) and np.isnan(x) else x for x in record.tolist()
-            )
-            for record in df.to_records(index=False)
-        ],
+        convert_pandas_df_to_spark_rows(df=df),
         df.columns.tolist(),
     )
     engine = basic_spark_df_execution_engine
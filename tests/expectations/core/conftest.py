@@ -6,7 +6,7 @@ import pytest
 from great_expectations.data_context.util import file_relative_path
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def titanic_df() -> pd.DataFrame:
     path = file_relative_path(
         __file__,
@@ -1,6 +1,5 @@
 from typing import Any, Dict, List
 
-import numpy as np
 import pandas as pd
 import pytest
 
@@ -21,6 +20,7 @@ from great_expectations.expectations.metrics.map_metric_provider.column_map_cond
     _spark_column_map_condition_values,
     _sqlalchemy_column_map_condition_values,
 )
+from great_expectations.self_check.util import convert_pandas_df_to_spark_rows
 from great_expectations.validator.metric_configuration import MetricConfiguration
 from tests.expectations.test_util import get_table_columns_metric
 
@@ -77,12 +77,7 @@ def spark_execution_engine_with_mini_taxi_loaded(spark_session, mini_taxi_df):
 
     pandas_df = mini_taxi_df
     spark_df = spark_session.createDataFrame(
-        [
-            tuple(
-                None if isinstance(x, (float, int)) and np.isnan(x) else x for x in record.tolist()
-            )
-            for record in pandas_df.to_records(index=False)
-        ],
+        convert_pandas_df_to_spark_rows(df=pandas_df),
         pandas_df.columns.tolist(),
     )
     execution_engine: SparkDFExecutionEngine = SparkDFExecutionEngine(
@@ -1,8 +1,7 @@
-import copy
 import datetime
 import logging
 from decimal import Decimal
-from typing import Dict, Tuple, Union
+from typing import Dict, Final, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -20,6 +19,7 @@ from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
@@ -35,12 +35,145 @@ from great_expectations.self_check.util import (
     build_pandas_engine,
     build_sa_execution_engine,
     build_spark_engine,
+    convert_pandas_df_to_spark_rows,
 )
-from great_expectations.util import isclose
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
 from tests.expectations.test_util import get_table_columns_metric
 
+# Ten equal-width bins spanning the 0..9 "digits" column.
+_HISTOGRAM_BINS: Final[List[float]] = np.linspace(0.0, 9.0, 11).tolist()
+
+# Value set shared by the "column_values.in_set" condition, partial, and final metrics.
+_VALUE_SET: Final[List[int]] = [1, 2, 3]
+
+
+@pytest.fixture(scope="module")
+def names_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "names": [
+                "Ada Lovelace",
+                "Alan Kay",
+                "Donald Knuth",
+                "Edsger Dijkstra",
+                "Guido van Rossum",
+                "John McCarthy",
+                "Marvin Minsky",
+                "Ray Ozzie",
+            ]
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def names_pandas_engine(names_df: pd.DataFrame) -> PandasExecutionEngine:
+    return build_pandas_engine(names_df)
+
+
+@pytest.fixture(scope="module")
+def names_sa_engine(sa, names_df: pd.DataFrame) -> SqlAlchemyExecutionEngine:
+    return build_sa_execution_engine(names_df, sa)
+
+
+@pytest.fixture(scope="module")
+def names_spark_engine(
+    module_spark_session: pyspark.SparkSession, names_df: pd.DataFrame
+) -> SparkDFExecutionEngine:
+    return build_spark_engine(spark=module_spark_session, df=names_df, batch_id="my_id")
+
+
+@pytest.fixture(scope="module")
+def max_pandas_engine() -> PandasExecutionEngine:
+    df = pd.DataFrame({"a": [1, 2, 3, 3, None]})
+    batch = Batch(data=df)
+    return PandasExecutionEngine(batch_data_dict={batch.id: batch.data})
+
+
+@pytest.fixture(scope="module")
+def max_sa_engine(sa) -> SqlAlchemyExecutionEngine:
+    return build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 1, None]}), sa)
+
+
+@pytest.fixture(scope="module")
+def max_spark_engine(module_spark_session: pyspark.SparkSession) -> SparkDFExecutionEngine:
+    return build_spark_engine(
+        spark=module_spark_session, df=pd.DataFrame({"a": [1, 2, 1]}), batch_id="my_id"
+    )
+
+
+@pytest.fixture(scope="module")
+def unique_pandas_engine() -> PandasExecutionEngine:
+    return build_pandas_engine(pd.DataFrame({"a": [1, 2, 3, 3, 4, None]}))
+
+
+@pytest.fixture(scope="module")
+def unique_sa_engine(sa) -> SqlAlchemyExecutionEngine:
+    return build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 3, 3, None], "b": ["foo", "bar", "baz", "qux", "fish"]}),
+        sa,
+    )
+
+
+@pytest.fixture(scope="module")
+def unique_spark_engine(module_spark_session: pyspark.SparkSession) -> SparkDFExecutionEngine:
+    return build_spark_engine(
+        spark=module_spark_session,
+        df=pd.DataFrame(
+            {
+                "a": [1, 2, 3, 3, 4, None],
+                "b": [None, "foo", "bar", "baz", "qux", "fish"],
+            }
+        ),
+        batch_id="my_id",
+    )
+
+
+@pytest.fixture(scope="module")
+def column_pairs_equal_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        data={
+            "a": [0, 1, 9, 2],
+            "b": [5, 4, 3, 6],
+            "c": [5, 4, 3, 6],
+            "d": [7, 8, 9, 0],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def column_pairs_equal_sa_engine(
+    sa, column_pairs_equal_df: pd.DataFrame
+) -> SqlAlchemyExecutionEngine:
+    return build_sa_execution_engine(column_pairs_equal_df, sa)
+
+
+@pytest.fixture(scope="module")
+def column_pairs_equal_spark_engine(
+    module_spark_session: pyspark.SparkSession, column_pairs_equal_df: pd.DataFrame
+) -> SparkDFExecutionEngine:
+    return build_spark_engine(
+        spark=module_spark_session, df=column_pairs_equal_df, batch_id="my_id"
+    )
+
+
+@pytest.fixture
+def execution_engine(request, test_backends) -> ExecutionEngine:
+    # Resolves the engine fixture named by an indirect "execution_engine" parameter;
+    # "test_backends" is requested here so that backend parametrization reaches the sa/spark
+    # fixtures, which are only looked up by name at setup time.
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture(scope="module")
+def digits_df() -> pd.DataFrame:
+    return pd.DataFrame({"a": np.arange(10, dtype=np.int64)})
+
+
+@pytest.fixture(scope="module")
+def quantiles_df() -> pd.DataFrame:
+    return pd.DataFrame({"a": [1, 2, 3, 4]})
+
 
 @pytest.mark.unit
 def test_metric_loads_pd():
@@ -71,7 +204,6 @@ def test_basic_metric_pd():
     }
 
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
     assert results == {desired_metric.id: 3}
 
 
@@ -111,7 +243,6 @@ def test_column_sum_metric_pd(build_engine, dataframe, expected_result):
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
     assert results == {desired_metric.id: expected_result}
 
 
@@ -196,7 +327,6 @@ def test_column_mean_metric_pd(dataframe, expected_result):
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
     assert results == {desired_metric.id: expected_result}
 
 
@@ -283,69 +413,106 @@ def test_column_standard_deviation_metric_pd(build_engine, dataframe, expected_r
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
     assert results == {desired_metric.id: expected_result}
 
 
-@pytest.mark.unit
-def test_column_value_lengths_min_metric_pd():
-    engine = build_pandas_engine(
-        pd.DataFrame(
-            {
-                "names": [
-                    "Ada Lovelace",
-                    "Alan Kay",
-                    "Donald Knuth",
-                    "Edsger Dijkstra",
-                    "Guido van Rossum",
-                    "John McCarthy",
-                    "Marvin Minsky",
-                    "Ray Ozzie",
-                ]
-            }
-        )
-    )
-
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+@pytest.mark.parametrize(
+    "execution_engine,metric_name,expected_result",
+    [
+        pytest.param(
+            "names_pandas_engine",
+            "column_values.length.min",
+            8,
+            id="pandas-min",
+            marks=pytest.mark.unit,
+        ),
+        pytest.param(
+            "names_sa_engine",
+            "column_values.length.min",
+            8,
+            id="sqlite-min",
+            marks=pytest.mark.sqlite,
+        ),
+        pytest.param(
+            "names_spark_engine",
+            "column_values.length.min",
+            8,
+            id="spark-min",
+            marks=pytest.mark.spark,
+        ),
+        pytest.param(
+            "names_pandas_engine",
+            "column_values.length.max",
+            16,
+            id="pandas-max",
+            marks=pytest.mark.big,
+        ),
+        pytest.param(
+            "names_sa_engine",
+            "column_values.length.max",
+            16,
+            id="sqlite-max",
+            marks=pytest.mark.sqlite,
+        ),
+        pytest.param(
+            "names_spark_engine",
+            "column_values.length.max",
+            16,
+            id="spark-max",
+            marks=pytest.mark.spark,
+        ),
+    ],
+    indirect=["execution_engine"],
+)
+def test_column_value_lengths_metric(
+    execution_engine: ExecutionEngine, metric_name: str, expected_result: int
+):
+    engine = execution_engine
 
     table_columns_metric: MetricConfiguration
     results: Dict[Tuple[str, str, str], MetricValue]
 
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
 
-    desired_metric = MetricConfiguration(
-        metric_name="column_values.length.min",
-        metric_domain_kwargs={"column": "names"},
-        metric_value_kwargs=None,
-    )
-    desired_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results == {desired_metric.id: 8}
+    if isinstance(engine, PandasExecutionEngine):
+        desired_metric = MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "names"},
+            metric_value_kwargs=None,
+        )
+        desired_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+    else:
+        aggregate_fn_metric = MetricConfiguration(
+            metric_name=f"{metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            metric_domain_kwargs={
+                "column": "names",
+            },
+            metric_value_kwargs=None,
+        )
+        aggregate_fn_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,))
+
+        desired_metric = MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={},
+            metric_value_kwargs=None,
+        )
+        desired_metric.metric_dependencies = {
+            "metric_partial_fn": aggregate_fn_metric,
+        }
+
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=results)
+
+    assert results == {desired_metric.id: expected_result}
 
 
 @pytest.mark.sqlite
-def test_column_quoted_name_type_sa(sa):
-    engine = build_sa_execution_engine(
-        pd.DataFrame(
-            {
-                "names": [
-                    "Ada Lovelace",
-                    "Alan Kay",
-                    "Donald Knuth",
-                    "Edsger Dijkstra",
-                    "Guido van Rossum",
-                    "John McCarthy",
-                    "Marvin Minsky",
-                    "Ray Ozzie",
-                ]
-            }
-        ),
-        sa,
-    )
+def test_column_quoted_name_type_sa(names_sa_engine):
+    engine = names_sa_engine
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -458,25 +625,9 @@ def test_column_quoted_name_type_sa_handles_explicit_string_identifiers(sa):
         assert str_column_name == column_name
 
 
-@pytest.mark.sqlite
-def test_column_value_lengths_min_metric_sa(sa):
-    engine = build_sa_execution_engine(
-        pd.DataFrame(
-            {
-                "names": [
-                    "Ada Lovelace",
-                    "Alan Kay",
-                    "Donald Knuth",
-                    "Edsger Dijkstra",
-                    "Guido van Rossum",
-                    "John McCarthy",
-                    "Marvin Minsky",
-                    "Ray Ozzie",
-                ]
-            }
-        ),
-        sa,
-    )
+@pytest.mark.unit
+def test_quantiles_metric_pd(quantiles_df):
+    engine = build_pandas_engine(quantiles_df)
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -486,51 +637,24 @@ def test_column_value_lengths_min_metric_sa(sa):
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
-    aggregate_fn_metric = MetricConfiguration(
-        metric_name=f"column_values.length.min.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
-        metric_domain_kwargs={
-            "column": "names",
-        },
-        metric_value_kwargs=None,
-    )
-    aggregate_fn_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,))
-
     desired_metric = MetricConfiguration(
-        metric_name="column_values.length.min",
-        metric_domain_kwargs={},
-        metric_value_kwargs=None,
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": [2.5e-1, 5.0e-1, 7.5e-1],
+            "allow_relative_error": "linear",
+        },
     )
     desired_metric.metric_dependencies = {
-        "metric_partial_fn": aggregate_fn_metric,
+        "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=results)
-
-    assert results == {desired_metric.id: 8}
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+    assert results == {desired_metric.id: [1.75, 2.5, 3.25]}
 
 
-@pytest.mark.spark
-def test_column_value_lengths_min_metric_spark(spark_session):
-    engine = build_spark_engine(
-        spark=spark_session,
-        df=pd.DataFrame(
-            {
-                "names": [
-                    "Ada Lovelace",
-                    "Alan Kay",
-                    "Donald Knuth",
-                    "Edsger Dijkstra",
-                    "Guido van Rossum",
-                    "John McCarthy",
-                    "Marvin Minsky",
-                    "Ray Ozzie",
-                ]
-            }
-        ),
-        batch_id="my_id",
-    )
+@pytest.mark.sqlite
+def test_quantiles_metric_sa(sa, quantiles_df):
+    engine = build_sa_execution_engine(quantiles_df, sa)
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -540,48 +664,47 @@ def test_column_value_lengths_min_metric_spark(spark_session):
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
-    aggregate_fn_metric = MetricConfiguration(
-        metric_name=f"column_values.length.min.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
-        metric_domain_kwargs={
-            "column": "names",
-        },
+    partial_metric = MetricConfiguration(
+        metric_name=f"table.row_count.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={},
         metric_value_kwargs=None,
     )
-    aggregate_fn_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,))
 
-    desired_metric = MetricConfiguration(
-        metric_name="column_values.length.min",
+    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
+    metrics.update(results)
+
+    table_row_count_metric = MetricConfiguration(
+        metric_name="table.row_count",
         metric_domain_kwargs={},
         metric_value_kwargs=None,
     )
-    desired_metric.metric_dependencies = {
-        "metric_partial_fn": aggregate_fn_metric,
+    table_row_count_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=results)
+    results = engine.resolve_metrics(metrics_to_resolve=(table_row_count_metric,), metrics=metrics)
+    metrics.update(results)
 
-    assert results == {desired_metric.id: 8}
+    desired_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": [2.5e-1, 5.0e-1, 7.5e-1],
+        },
+    )
+    desired_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+        "table.row_count": table_row_count_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+    assert results == {desired_metric.id: [1.0, 2.0, 3.0]}
 
 
-@pytest.mark.big
-def test_column_value_lengths_max_metric_pd():
-    engine = build_pandas_engine(
-        pd.DataFrame(
-            {
-                "names": [
-                    "Ada Lovelace",
-                    "Alan Kay",
-                    "Donald Knuth",
-                    "Edsger Dijkstra",
-                    "Guido van Rossum",
-                    "John McCarthy",
-                    "Marvin Minsky",
-                    "Ray Ozzie",
-                ]
-            }
-        )
+@pytest.mark.spark
+def test_quantiles_metric_spark(spark_session, quantiles_df):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=quantiles_df,
+        batch_id="my_id",
     )
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
@@ -593,252 +716,22 @@ def test_column_value_lengths_max_metric_pd():
     metrics.update(results)
 
     desired_metric = MetricConfiguration(
-        metric_name="column_values.length.max",
-        metric_domain_kwargs={"column": "names"},
-        metric_value_kwargs=None,
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": [2.5e-1, 5.0e-1, 7.5e-1],
+        },
     )
     desired_metric.metric_dependencies = {
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results == {desired_metric.id: 16}
-
-
-@pytest.mark.sqlite
-def test_column_value_lengths_max_metric_sa(sa):
-    engine = build_sa_execution_engine(
-        pd.DataFrame(
-            {
-                "names": [
-                    "Ada Lovelace",
-                    "Alan Kay",
-                    "Donald Knuth",
-                    "Edsger Dijkstra",
-                    "Guido van Rossum",
-                    "John McCarthy",
-                    "Marvin Minsky",
-                    "Ray Ozzie",
-                ]
-            }
-        ),
-        sa,
-    )
-
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-    table_columns_metric: MetricConfiguration
-    results: Dict[Tuple[str, str, str], MetricValue]
-
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
-
-    aggregate_fn_metric = MetricConfiguration(
-        metric_name=f"column_values.length.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
-        metric_domain_kwargs={
-            "column": "names",
-        },
-        metric_value_kwargs=None,
-    )
-    aggregate_fn_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,))
-
-    desired_metric = MetricConfiguration(
-        metric_name="column_values.length.max",
-        metric_domain_kwargs={},
-        metric_value_kwargs=None,
-    )
-    desired_metric.metric_dependencies = {
-        "metric_partial_fn": aggregate_fn_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=results)
-
-    assert results == {desired_metric.id: 16}
-
-
-@pytest.mark.spark
-def test_column_value_lengths_max_metric_spark(spark_session):
-    engine = build_spark_engine(
-        spark=spark_session,
-        df=pd.DataFrame(
-            {
-                "names": [
-                    "Ada Lovelace",
-                    "Alan Kay",
-                    "Donald Knuth",
-                    "Edsger Dijkstra",
-                    "Guido van Rossum",
-                    "John McCarthy",
-                    "Marvin Minsky",
-                    "Ray Ozzie",
-                ]
-            }
-        ),
-        batch_id="my_id",
-    )
-
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-    table_columns_metric: MetricConfiguration
-    results: Dict[Tuple[str, str, str], MetricValue]
-
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
-
-    aggregate_fn_metric = MetricConfiguration(
-        metric_name=f"column_values.length.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
-        metric_domain_kwargs={
-            "column": "names",
-        },
-        metric_value_kwargs=None,
-    )
-    aggregate_fn_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,))
-
-    desired_metric = MetricConfiguration(
-        metric_name="column_values.length.max",
-        metric_domain_kwargs={},
-        metric_value_kwargs=None,
-    )
-    desired_metric.metric_dependencies = {
-        "metric_partial_fn": aggregate_fn_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=results)
-
-    assert results == {desired_metric.id: 16}
+    assert results == {desired_metric.id: [1.0, 2.0, 3.0]}
 
 
 @pytest.mark.unit
-def test_quantiles_metric_pd():
-    engine = build_pandas_engine(pd.DataFrame({"a": [1, 2, 3, 4]}))
-
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-    table_columns_metric: MetricConfiguration
-    results: Dict[Tuple[str, str, str], MetricValue]
-
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
-
-    desired_metric = MetricConfiguration(
-        metric_name="column.quantile_values",
-        metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs={
-            "quantiles": [2.5e-1, 5.0e-1, 7.5e-1],
-            "allow_relative_error": "linear",
-        },
-    )
-    desired_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results == {desired_metric.id: [1.75, 2.5, 3.25]}
-
-
-@pytest.mark.sqlite
-def test_quantiles_metric_sa(sa):
-    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 3, 4]}), sa)
-
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-    table_columns_metric: MetricConfiguration
-    results: Dict[Tuple[str, str, str], MetricValue]
-
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
-
-    partial_metric = MetricConfiguration(
-        metric_name=f"table.row_count.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
-        metric_domain_kwargs={},
-        metric_value_kwargs=None,
-    )
-
-    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
-    metrics.update(results)
-
-    table_row_count_metric = MetricConfiguration(
-        metric_name="table.row_count",
-        metric_domain_kwargs={},
-        metric_value_kwargs=None,
-    )
-    table_row_count_metric.metric_dependencies = {
-        "metric_partial_fn": partial_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(table_row_count_metric,), metrics=metrics)
-    metrics.update(results)
-
-    desired_metric = MetricConfiguration(
-        metric_name="column.quantile_values",
-        metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs={
-            "quantiles": [2.5e-1, 5.0e-1, 7.5e-1],
-        },
-    )
-    desired_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-        "table.row_count": table_row_count_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results == {desired_metric.id: [1.0, 2.0, 3.0]}
-
-
-@pytest.mark.spark
-def test_quantiles_metric_spark(spark_session):
-    engine: SparkDFExecutionEngine = build_spark_engine(
-        spark=spark_session,
-        df=pd.DataFrame({"a": [1, 2, 3, 4]}),
-        batch_id="my_id",
-    )
-
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-    table_columns_metric: MetricConfiguration
-    results: Dict[Tuple[str, str, str], MetricValue]
-
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
-
-    desired_metric = MetricConfiguration(
-        metric_name="column.quantile_values",
-        metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs={
-            "quantiles": [2.5e-1, 5.0e-1, 7.5e-1],
-        },
-    )
-    desired_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results == {desired_metric.id: [1.0, 2.0, 3.0]}
-
-
-@pytest.mark.unit
-def test_column_histogram_metric_pd():
-    engine = build_pandas_engine(
-        pd.DataFrame(
-            {
-                "a": [
-                    0,
-                    1,
-                    2,
-                    3,
-                    4,
-                    5,
-                    6,
-                    7,
-                    8,
-                    9,
-                ]
-            }
-        )
-    )
+def test_column_histogram_metric_pd(digits_df):
+    engine = build_pandas_engine(digits_df)
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -852,48 +745,20 @@ def test_column_histogram_metric_pd():
         metric_name="column.histogram",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs={
-            "bins": [0.0, 0.9, 1.8, 2.7, 3.6, 4.5, 5.4, 6.3, 7.2, 8.1, 9.0],
+            "bins": _HISTOGRAM_BINS,
         },
     )
     desired_metric.metric_dependencies = {
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
     assert results == {desired_metric.id: [1, 1, 1, 1, 1, 1, 1, 1, 1, 1]}
 
 
 @pytest.mark.sqlite
-def test_column_histogram_metric_sa(sa):
+def test_column_histogram_metric_sa(sa, digits_df):
     engine = build_sa_execution_engine(
-        pd.DataFrame(
-            {
-                "a": [
-                    0,
-                    1,
-                    2,
-                    3,
-                    4,
-                    5,
-                    6,
-                    7,
-                    8,
-                    9,
-                ],
-                "b": [
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                ],
-            }
-        ),
+        digits_df.assign(b=np.zeros(10, dtype=np.int64)),
         sa,
     )
 
@@ -909,7 +774,7 @@ def test_column_histogram_metric_sa(sa):
         metric_name="column.histogram",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs={
-            "bins": [0.0, 0.9, 1.8, 2.7, 3.6, 4.5, 5.4, 6.3, 7.2, 8.1, 9.0],
+            "bins": _HISTOGRAM_BINS,
         },
     )
     desired_metric.metric_dependencies = {
@@ -930,30 +795,14 @@ def test_column_histogram_metric_sa(sa):
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
     assert results == {desired_metric.id: [10]}
 
 
 @pytest.mark.spark
-def test_column_histogram_metric_spark(spark_session):
+def test_column_histogram_metric_spark(spark_session, digits_df):
     engine: SparkDFExecutionEngine = build_spark_engine(
         spark=spark_session,
-        df=pd.DataFrame(
-            {
-                "a": [
-                    0,
-                    1,
-                    2,
-                    3,
-                    4,
-                    5,
-                    6,
-                    7,
-                    8,
-                    9,
-                ]
-            }
-        ),
+        df=digits_df,
         batch_id="my_id",
     )
 
@@ -969,14 +818,13 @@ def test_column_histogram_metric_spark(spark_session):
         metric_name="column.histogram",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs={
-            "bins": [0.0, 0.9, 1.8, 2.7, 3.6, 4.5, 5.4, 6.3, 7.2, 8.1, 9.0],
+            "bins": _HISTOGRAM_BINS,
         },
     )
     desired_metric.metric_dependencies = {
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
     assert results == {desired_metric.id: [1, 1, 1, 1, 1, 1, 1, 1, 1, 1]}
 
 
@@ -994,7 +842,6 @@ def test_column_partition_metric_pd():
 
     Expected partition boundaries are pre-computed algorithmically and asserted to be "close" to actual metric values.
     """  # noqa: E501
-    week_idx: int
     engine = build_pandas_engine(
         pd.DataFrame(
             {
@@ -1012,10 +859,7 @@ def test_column_partition_metric_pd():
                     10,
                     11,
                 ],
-                "b": [
-                    datetime.datetime(2021, 1, 1, 0, 0, 0) + datetime.timedelta(days=(week_idx * 7))  # noqa: DTZ001
-                    for week_idx in range(12)
-                ],
+                "b": pd.date_range(start="2021-01-01", periods=12, freq="7D"),
             },
         ),
     )
@@ -1025,8 +869,6 @@ def test_column_partition_metric_pd():
     n_bins: int = 10
 
     increment: Union[float, datetime.timedelta]
-    idx: int
-    element: Union[float, pd.Timestamp]
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -1071,7 +913,6 @@ def test_column_partition_metric_pd():
         },
     )
     desired_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
         "column.min": column_min_metric,
         "column.max": column_max_metric,
     }
@@ -1079,16 +920,14 @@ def test_column_partition_metric_pd():
     metrics.update(results)
 
     increment = float(n_bins + 1) / n_bins
-    assert all(
-        isclose(operand_a=element, operand_b=(increment * idx))
-        for idx, element in enumerate(results[desired_metric.id])
+    np.testing.assert_allclose(
+        results[desired_metric.id],
+        increment * np.arange(n_bins + 1),
+        rtol=1.0e-5,
+        atol=1.0e-8,
     )
 
-    # Test using "datetime.datetime" column.
-
-    metrics = {}
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
+    # Test using "datetime.datetime" column; "metrics" already holds "table.columns" from above.
 
     column_min_metric: MetricConfiguration = MetricConfiguration(
         metric_name="column.min",
@@ -1123,25 +962,21 @@ def test_column_partition_metric_pd():
         },
     )
     desired_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
         "column.min": column_min_metric,
         "column.max": column_max_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
 
-    increment = datetime.timedelta(seconds=(seconds_in_week * float(n_bins + 1) / n_bins))
-    assert all(
-        isclose(
-            operand_a=element.to_pydatetime(),
-            operand_b=(datetime.datetime(2021, 1, 1, 0, 0, 0) + (increment * idx)),  # noqa: DTZ001
-        )
-        for idx, element in enumerate(results[desired_metric.id])
+    increment = pd.Timedelta(seconds=(seconds_in_week * float(n_bins + 1) / n_bins))
+    np.testing.assert_allclose(
+        pd.DatetimeIndex(results[desired_metric.id]).asi8,
+        pd.date_range(start="2021-01-01", periods=n_bins + 1, freq=increment).asi8,
+        rtol=1.0e-5,
     )
 
 
 @pytest.mark.sqlite
-def test_column_partition_metric_sa(sa):  # noqa: PLR0915
+def test_column_partition_metric_sa(sa):
     """
     Test of "column.partition" metric for both, standard numeric column and "datetime.datetime" valued column.
 
@@ -1155,7 +990,6 @@ def test_column_partition_metric_sa(sa):  # noqa: PLR0915
 
     Expected partition boundaries are pre-computed algorithmically and asserted to be "close" to actual metric values.
     """  # noqa: E501
-    week_idx: int
     engine = build_sa_execution_engine(
         pd.DataFrame(
             {
@@ -1173,10 +1007,7 @@ def test_column_partition_metric_sa(sa):  # noqa: PLR0915
                     10,
                     11,
                 ],
-                "b": [
-                    datetime.datetime(2021, 1, 1, 0, 0, 0) + datetime.timedelta(days=(week_idx * 7))  # noqa: DTZ001
-                    for week_idx in range(12)
-                ],
+                "b": pd.date_range(start="2021-01-01", periods=12, freq="7D"),
             },
         ),
         sa,
@@ -1187,8 +1018,6 @@ def test_column_partition_metric_sa(sa):  # noqa: PLR0915
     n_bins: int = 10
 
     increment: Union[float, datetime.timedelta]
-    idx: int
-    element: Union[float, pd.Timestamp]
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -1231,7 +1060,6 @@ def test_column_partition_metric_sa(sa):  # noqa: PLR0915
     )
     column_min_metric.metric_dependencies = {
         "metric_partial_fn": partial_column_min_metric,
-        "table.columns": table_columns_metric,
     }
     column_max_metric: MetricConfiguration = MetricConfiguration(
         metric_name="column.max",
@@ -1239,7 +1067,6 @@ def test_column_partition_metric_sa(sa):  # noqa: PLR0915
     )
     column_max_metric.metric_dependencies = {
         "metric_partial_fn": partial_column_max_metric,
-        "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
         metrics_to_resolve=(
@@ -1260,7 +1087,6 @@ def test_column_partition_metric_sa(sa):  # noqa: PLR0915
         },
     )
     desired_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
         "column.min": column_min_metric,
         "column.max": column_max_metric,
     }
@@ -1268,16 +1094,14 @@ def test_column_partition_metric_sa(sa):  # noqa: PLR0915
     metrics.update(results)
 
     increment = float(n_bins + 1) / n_bins
-    assert all(
-        isclose(operand_a=element, operand_b=(increment * idx))
-        for idx, element in enumerate(results[desired_metric.id])
+    np.testing.assert_allclose(
+        results[desired_metric.id],
+        increment * np.arange(n_bins + 1),
+        rtol=1.0e-5,
+        atol=1.0e-8,
     )
 
-    # Test using "datetime.datetime" column.
-
-    metrics = {}
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
+    # Test using "datetime.datetime" column; "metrics" already holds "table.columns" from above.
 
     partial_column_min_metric = MetricConfiguration(
         metric_name=f"column.min.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
@@ -1310,7 +1134,6 @@ def test_column_partition_metric_sa(sa):  # noqa: PLR0915
     )
     column_min_metric.metric_dependencies = {
         "metric_partial_fn": partial_column_min_metric,
-        "table.columns": table_columns_metric,
     }
     column_max_metric: MetricConfiguration = MetricConfiguration(
         metric_name="column.max",
@@ -1318,7 +1141,6 @@ def test_column_partition_metric_sa(sa):  # noqa: PLR0915
     )
     column_max_metric.metric_dependencies = {
         "metric_partial_fn": partial_column_max_metric,
-        "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
         metrics_to_resolve=(
@@ -1339,25 +1161,21 @@ def test_column_partition_metric_sa(sa):  # noqa: PLR0915
         },
     )
     desired_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
         "column.min": column_min_metric,
         "column.max": column_max_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
 
-    increment = datetime.timedelta(seconds=(seconds_in_week * float(n_bins + 1) / n_bins))
-    assert all(
-        isclose(
-            operand_a=element,
-            operand_b=(datetime.datetime(2021, 1, 1, 0, 0, 0) + (increment * idx)),  # noqa: DTZ001
-        )
-        for idx, element in enumerate(results[desired_metric.id])
+    increment = pd.Timedelta(seconds=(seconds_in_week * float(n_bins + 1) / n_bins))
+    np.testing.assert_allclose(
+        pd.DatetimeIndex(results[desired_metric.id]).asi8,
+        pd.date_range(start="2021-01-01", periods=n_bins + 1, freq=increment).asi8,
+        rtol=1.0e-5,
     )
 
 
 @pytest.mark.spark
-def test_column_partition_metric_spark(spark_session):  # noqa: PLR0915
+def test_column_partition_metric_spark(spark_session):
     """
     Test of "column.partition" metric for both, standard numeric column and "datetime.datetime" valued column.
 
@@ -1371,7 +1189,6 @@ def test_column_partition_metric_spark(spark_session):  # noqa: PLR0915
 
     Expected partition boundaries are pre-computed algorithmically and asserted to be "close" to actual metric values.
     """  # noqa: E501
-    week_idx: int
     engine: SparkDFExecutionEngine = build_spark_engine(
         spark=spark_session,
         df=pd.DataFrame(
@@ -1390,10 +1207,7 @@ def test_column_partition_metric_spark(spark_session):  # noqa: PLR0915
                     10,
                     11,
                 ],
-                "b": [
-                    datetime.datetime(2021, 1, 1, 0, 0, 0) + datetime.timedelta(days=(week_idx * 7))  # noqa: DTZ001
-                    for week_idx in range(12)
-                ],
+                "b": pd.date_range(start="2021-01-01", periods=12, freq="7D"),
             },
         ),
         schema=pyspark.types.StructType(
@@ -1410,8 +1224,6 @@ def test_column_partition_metric_spark(spark_session):  # noqa: PLR0915
     n_bins: int = 10
 
     increment: Union[float, datetime.timedelta]
-    idx: int
-    element: Union[float, pd.Timestamp]
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -1454,7 +1266,6 @@ def test_column_partition_metric_spark(spark_session):  # noqa: PLR0915
     )
     column_min_metric.metric_dependencies = {
         "metric_partial_fn": partial_column_min_metric,
-        "table.columns": table_columns_metric,
     }
     column_max_metric: MetricConfiguration = MetricConfiguration(
         metric_name="column.max",
@@ -1462,7 +1273,6 @@ def test_column_partition_metric_spark(spark_session):  # noqa: PLR0915
     )
     column_max_metric.metric_dependencies = {
         "metric_partial_fn": partial_column_max_metric,
-        "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
         metrics_to_resolve=(
@@ -1483,7 +1293,6 @@ def test_column_partition_metric_spark(spark_session):  # noqa: PLR0915
         },
     )
     desired_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
         "column.min": column_min_metric,
         "column.max": column_max_metric,
     }
@@ -1491,16 +1300,14 @@ def test_column_partition_metric_spark(spark_session):  # noqa: PLR0915
     metrics.update(results)
 
     increment = float(n_bins + 1) / n_bins
-    assert all(
-        isclose(operand_a=element, operand_b=(increment * idx))
-        for idx, element in enumerate(results[desired_metric.id])
+    np.testing.assert_allclose(
+        results[desired_metric.id],
+        increment * np.arange(n_bins + 1),
+        rtol=1.0e-5,
+        atol=1.0e-8,
     )
 
-    # Test using "datetime.datetime" column.
-
-    metrics = {}
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
+    # Test using "datetime.datetime" column; "metrics" already holds "table.columns" from above.
 
     partial_column_min_metric = MetricConfiguration(
         metric_name=f"column.min.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
@@ -1533,7 +1340,6 @@ def test_column_partition_metric_spark(spark_session):  # noqa: PLR0915
     )
     column_min_metric.metric_dependencies = {
         "metric_partial_fn": partial_column_min_metric,
-        "table.columns": table_columns_metric,
     }
     column_max_metric: MetricConfiguration = MetricConfiguration(
         metric_name="column.max",
@@ -1541,7 +1347,6 @@ def test_column_partition_metric_spark(spark_session):  # noqa: PLR0915
     )
     column_max_metric.metric_dependencies = {
         "metric_partial_fn": partial_column_max_metric,
-        "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
         metrics_to_resolve=(
@@ -1562,83 +1367,30 @@ def test_column_partition_metric_spark(spark_session):  # noqa: PLR0915
         },
     )
     desired_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
         "column.min": column_min_metric,
         "column.max": column_max_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-
-    increment = datetime.timedelta(seconds=(seconds_in_week * float(n_bins + 1) / n_bins))
-    assert all(
-        isclose(
-            operand_a=element,
-            operand_b=(datetime.datetime(2021, 1, 1, 0, 0, 0) + (increment * idx)),  # noqa: DTZ001
-        )
-        for idx, element in enumerate(results[desired_metric.id])
-    )
-
-
-@pytest.mark.unit
-def test_max_metric_column_exists_pd():
-    df = pd.DataFrame({"a": [1, 2, 3, 3, None]})
-    batch = Batch(data=df)
-    engine = PandasExecutionEngine(batch_data_dict={batch.id: batch.data})
-
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-    table_columns_metric: MetricConfiguration
-    results: Dict[Tuple[str, str, str], MetricValue]
 
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
-
-    desired_metric = MetricConfiguration(
-        metric_name="column.max",
-        metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs=None,
-    )
-    desired_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results == {desired_metric.id: 3}
-
-
-@pytest.mark.unit
-def test_max_metric_column_does_not_exist_pd():
-    df = pd.DataFrame({"a": [1, 2, 3, 3, None]})
-    batch = Batch(data=df)
-    engine = PandasExecutionEngine(batch_data_dict={batch.id: batch.data})
-
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-    table_columns_metric: MetricConfiguration
-    results: Dict[Tuple[str, str, str], MetricValue]
-
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
-
-    desired_metric = MetricConfiguration(
-        metric_name="column.max",
-        metric_domain_kwargs={"column": "non_existent_column"},
-        metric_value_kwargs=None,
+    increment = pd.Timedelta(seconds=(seconds_in_week * float(n_bins + 1) / n_bins))
+    np.testing.assert_allclose(
+        pd.DatetimeIndex(results[desired_metric.id]).asi8,
+        pd.date_range(start="2021-01-01", periods=n_bins + 1, freq=increment).asi8,
+        rtol=1.0e-5,
     )
-    desired_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-
-    with pytest.raises(gx_exceptions.MetricResolutionError) as eee:
-        # noinspection PyUnusedLocal
-        results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-        metrics.update(results)
-    assert str(eee.value) == 'Error: The column "non_existent_column" in BatchData does not exist.'
 
 
-@pytest.mark.sqlite
-def test_max_metric_column_exists_sa(sa):
-    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 1, None]}), sa)
+@pytest.mark.parametrize(
+    "execution_engine,expected_result",
+    [
+        pytest.param("max_pandas_engine", 3, id="pandas", marks=pytest.mark.unit),
+        pytest.param("max_sa_engine", 2, id="sqlite", marks=pytest.mark.sqlite),
+        pytest.param("max_spark_engine", 2, id="spark", marks=pytest.mark.spark),
+    ],
+    indirect=["execution_engine"],
+)
+def test_max_metric_column_exists(execution_engine: ExecutionEngine, expected_result: int):
+    engine = execution_engine
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -1648,111 +1400,57 @@ def test_max_metric_column_exists_sa(sa):
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
-    partial_metric = MetricConfiguration(
-        metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
-        metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs=None,
-    )
-    partial_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-
-    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
-    metrics.update(results)
-
     desired_metric = MetricConfiguration(
         metric_name="column.max",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
-        "metric_partial_fn": partial_metric,
         "table.columns": table_columns_metric,
     }
 
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results == {desired_metric.id: 2}
-
-
-@pytest.mark.sqlite
-def test_max_metric_column_does_not_exist_sa(sa):
-    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 1, None]}), sa)
-
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-    table_columns_metric: MetricConfiguration
-    results: Dict[Tuple[str, str, str], MetricValue]
-
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
-
-    partial_metric = MetricConfiguration(
-        metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
-        metric_domain_kwargs={"column": "non_existent_column"},
-        metric_value_kwargs=None,
-    )
-    partial_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
+    if not isinstance(engine, PandasExecutionEngine):
+        partial_metric = MetricConfiguration(
+            metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+        )
+        partial_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
 
-    with pytest.raises(gx_exceptions.MetricResolutionError) as eee:
-        # noinspection PyUnusedLocal
         results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
         metrics.update(results)
-    assert 'Error: The column "non_existent_column" in BatchData does not exist.' in str(eee.value)
 
-
-@pytest.mark.spark
-def test_max_metric_column_exists_spark(spark_session):
-    engine: SparkDFExecutionEngine = build_spark_engine(
-        spark=spark_session,
-        df=pd.DataFrame({"a": [1, 2, 1]}),
-        batch_id="my_id",
-    )
-
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-    table_columns_metric: MetricConfiguration
-    results: Dict[Tuple[str, str, str], MetricValue]
-
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
-
-    partial_metric = MetricConfiguration(
-        metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
-        metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs=None,
-    )
-    partial_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-
-    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
-    metrics.update(results)
-
-    desired_metric = MetricConfiguration(
-        metric_name="column.max",
-        metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs=None,
-    )
-    desired_metric.metric_dependencies = {
-        "metric_partial_fn": partial_metric,
-        "table.columns": table_columns_metric,
-    }
+        desired_metric.metric_dependencies = {
+            "metric_partial_fn": partial_metric,
+        }
 
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results == {desired_metric.id: 2}
+    assert results == {desired_metric.id: expected_result}
 
 
-@pytest.mark.spark
-def test_max_metric_column_does_not_exist_spark(spark_session):
-    engine: SparkDFExecutionEngine = build_spark_engine(
-        spark=spark_session,
-        df=pd.DataFrame({"a": [1, 2, 1]}),
-        batch_id="my_id",
-    )
+@pytest.mark.parametrize(
+    "execution_engine,metric_name",
+    [
+        pytest.param("max_pandas_engine", "column.max", id="pandas", marks=pytest.mark.unit),
+        pytest.param(
+            "max_sa_engine",
+            f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            id="sqlite",
+            marks=pytest.mark.sqlite,
+        ),
+        pytest.param(
+            "max_spark_engine",
+            f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            id="spark",
+            marks=pytest.mark.spark,
+        ),
+    ],
+    indirect=["execution_engine"],
+)
+def test_max_metric_column_does_not_exist(execution_engine: ExecutionEngine, metric_name: str):
+    engine = execution_engine
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -1762,19 +1460,18 @@ def test_max_metric_column_does_not_exist_spark(spark_session):
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
-    partial_metric = MetricConfiguration(
-        metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+    desired_metric = MetricConfiguration(
+        metric_name=metric_name,
         metric_domain_kwargs={"column": "non_existent_column"},
         metric_value_kwargs=None,
     )
-    partial_metric.metric_dependencies = {
+    desired_metric.metric_dependencies = {
         "table.columns": table_columns_metric,
     }
 
     with pytest.raises(gx_exceptions.MetricResolutionError) as eee:
         # noinspection PyUnusedLocal
-        results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
-        metrics.update(results)
+        results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
     assert str(eee.value) == 'Error: The column "non_existent_column" in BatchData does not exist.'
 
 
@@ -1793,7 +1490,7 @@ def test_map_value_set_sa(sa):
     desired_metric = MetricConfiguration(
         metric_name=f"column_values.in_set.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
         metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs={"value_set": [1, 2, 3]},
+        metric_value_kwargs={"value_set": _VALUE_SET},
     )
     desired_metric.metric_dependencies = {
         "table.columns": table_columns_metric,
@@ -1804,7 +1501,7 @@ def test_map_value_set_sa(sa):
     aggregate_partial = MetricConfiguration(
         metric_name=f"column_values.in_set.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
         metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs={"value_set": [1, 2, 3]},
+        metric_value_kwargs={"value_set": _VALUE_SET},
     )
     aggregate_partial.metric_dependencies = {
         "unexpected_condition": desired_metric,
@@ -1814,7 +1511,7 @@ def test_map_value_set_sa(sa):
     desired_metric = MetricConfiguration(
         metric_name=f"column_values.in_set.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
         metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs={"value_set": [1, 2, 3]},
+        metric_value_kwargs={"value_set": _VALUE_SET},
     )
     desired_metric.metric_dependencies = {
         "metric_partial_fn": aggregate_partial,
@@ -1846,14 +1543,30 @@ def test_map_of_type_sa(sa):
 
 
 @pytest.mark.spark
-def test_map_value_set_spark(spark_session, basic_spark_df_execution_engine):
-    engine: SparkDFExecutionEngine = build_spark_engine(
-        spark=spark_session,
-        df=pd.DataFrame(
-            {"a": [1, 2, 3, 3, None]},
-        ),
-        batch_id="my_id",
-    )
+@pytest.mark.parametrize(
+    "missing_as_nan,expected_unexpected_count",
+    [
+        # Rows built the way "build_spark_engine" builds them turn the missing value into NULL.
+        pytest.param(False, 0, id="null"),
+        # A pandas DataFrame handed to Spark directly keeps it as nan, which is not in the set.
+        pytest.param(True, 1, id="nan"),
+    ],
+)
+def test_map_value_set_spark(
+    spark_session,
+    basic_spark_df_execution_engine,
+    missing_as_nan: bool,
+    expected_unexpected_count: int,
+):
+    df = pd.DataFrame({"a": [1, 2, 3, 3, None]})
+    if missing_as_nan:
+        spark_df = spark_session.createDataFrame(df)
+    else:
+        spark_df = spark_session.createDataFrame(
+            data=convert_pandas_df_to_spark_rows(df=df), schema=df.columns.tolist()
+        )
+    engine: SparkDFExecutionEngine = basic_spark_df_execution_engine
+    engine.load_batch_data(batch_id="my_id", batch_data=spark_df)
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -1863,64 +1576,10 @@ def test_map_value_set_spark(spark_session, basic_spark_df_execution_engine):
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
-    condition_metric = MetricConfiguration(
-        metric_name=f"column_values.in_set.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
-        metric_domain_kwargs={
-            "column": "a",
-        },
-        metric_value_kwargs={
-            "value_set": [1, 2, 3],
-        },
-    )
-    condition_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(condition_metric,), metrics=metrics)
-    metrics.update(results)
-
-    # Note: metric_dependencies is optional here in the config when called from a validator.
-    aggregate_partial = MetricConfiguration(
-        metric_name=f"column_values.in_set.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
-        metric_domain_kwargs={
-            "column": "a",
-        },
-        metric_value_kwargs={
-            "value_set": [1, 2, 3],
-        },
-    )
-    aggregate_partial.metric_dependencies = {
-        "unexpected_condition": condition_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_partial,), metrics=metrics)
-    metrics.update(results)
-    desired_metric = MetricConfiguration(
-        metric_name=f"column_values.in_set.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
-        metric_domain_kwargs={
-            "column": "a",
-        },
-        metric_value_kwargs={
-            "value_set": [1, 2, 3],
-        },
-    )
-    desired_metric.metric_dependencies = {
-        "metric_partial_fn": aggregate_partial,
-    }
-
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results == {desired_metric.id: 0}
-
-    # We run the same computation again, this time with None being replaced by nan instead of NULL
-    # to demonstrate this behavior
-    df = pd.DataFrame({"a": [1, 2, 3, 3, None]})
-    df = spark_session.createDataFrame(df)
-    engine = basic_spark_df_execution_engine
-    engine.load_batch_data(batch_id="my_id", batch_data=df)
-
     condition_metric = MetricConfiguration(
         metric_name=f"column_values.in_set.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
         metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs={"value_set": [1, 2, 3]},
+        metric_value_kwargs={"value_set": _VALUE_SET},
     )
     condition_metric.metric_dependencies = {
         "table.columns": table_columns_metric,
@@ -1932,7 +1591,7 @@ def test_map_value_set_spark(spark_session, basic_spark_df_execution_engine):
     aggregate_partial = MetricConfiguration(
         metric_name=f"column_values.in_set.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
         metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs={"value_set": [1, 2, 3]},
+        metric_value_kwargs={"value_set": _VALUE_SET},
     )
     aggregate_partial.metric_dependencies = {
         "unexpected_condition": condition_metric,
@@ -1942,15 +1601,14 @@ def test_map_value_set_spark(spark_session, basic_spark_df_execution_engine):
     desired_metric = MetricConfiguration(
         metric_name=f"column_values.in_set.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
         metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs={"value_set": [1, 2, 3]},
+        metric_value_kwargs={"value_set": _VALUE_SET},
     )
     desired_metric.metric_dependencies = {
         "metric_partial_fn": aggregate_partial,
     }
 
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results == {desired_metric.id: 1}
+    assert results == {desired_metric.id: expected_unexpected_count}
 
 
 @pytest.mark.unit
@@ -1974,7 +1632,6 @@ def test_map_column_value_lengths_between_pd():
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
 
     result_series, _, _ = results[desired_metric.id]
 
@@ -1982,9 +1639,6 @@ def test_map_column_value_lengths_between_pd():
     assert ser_expected_lengths.equals(result_series)
 
 
-@pytest.mark.filterwarnings(
-    "ignore:pandas.Int64Index is deprecated*:FutureWarning:tests.expectations.metrics"
-)
 @pytest.mark.big
 def test_map_column_values_increasing_pd():
     engine = build_pandas_engine(
@@ -2064,7 +1718,7 @@ def test_map_column_values_increasing_pd():
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics)
     metrics.update(results)
 
-    assert metrics[unexpected_rows_metric.id]["a"].index == pd.Index([4], dtype="int64")
+    assert metrics[unexpected_rows_metric.id]["a"].index.tolist() == [4]
 
 
 @pytest.mark.spark
@@ -2087,6 +1741,7 @@ def test_map_column_values_increasing_spark(spark_session):
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    # "get_table_columns_metric" has already resolved this exact configuration into "metrics".
     table_column_types = MetricConfiguration(
         metric_name="table.column_types",
         metric_domain_kwargs={},
@@ -2094,11 +1749,6 @@ def test_map_column_values_increasing_spark(spark_session):
             "include_nested": True,
         },
     )
-    results = engine.resolve_metrics(
-        metrics_to_resolve=(table_column_types,),
-        metrics=metrics,
-    )
-    metrics.update(results)
 
     condition_metric = MetricConfiguration(
         metric_name=f"column_values.increasing.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
@@ -2151,9 +1801,6 @@ def test_map_column_values_increasing_spark(spark_session):
 
 
 @pytest.mark.big
-@pytest.mark.filterwarnings(
-    "ignore:pandas.Int64Index is deprecated*:FutureWarning:tests.expectations.metrics"
-)
 def test_map_column_values_decreasing_pd():
     engine = build_pandas_engine(
         pd.DataFrame(
@@ -2204,20 +1851,6 @@ def test_map_column_values_decreasing_pd():
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
-    metrics.update(results)
-
-    assert list(metrics[condition_metric.id][0]) == [
-        False,
-        False,
-        False,
-        True,
-        False,
-        False,
-        False,
-    ]
-    assert metrics[unexpected_count_metric.id] == 1
-
     unexpected_rows_metric = MetricConfiguration(
         metric_name=f"column_values.decreasing.{SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value}",
         metric_domain_kwargs={"column": "a"},
@@ -2229,10 +1862,22 @@ def test_map_column_values_decreasing_pd():
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics)
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_count_metric, unexpected_rows_metric), metrics=metrics
+    )
     metrics.update(results)
 
-    assert metrics[unexpected_rows_metric.id]["a"].index == pd.Index([3], dtype="int64")
+    assert list(metrics[condition_metric.id][0]) == [
+        False,
+        False,
+        False,
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert metrics[unexpected_count_metric.id] == 1
+    assert metrics[unexpected_rows_metric.id]["a"].index.tolist() == [3]
 
 
 @pytest.mark.spark
@@ -2255,6 +1900,7 @@ def test_map_column_values_decreasing_spark(spark_session):
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    # "get_table_columns_metric" has already resolved this exact configuration into "metrics".
     table_column_types = MetricConfiguration(
         metric_name="table.column_types",
         metric_domain_kwargs={},
@@ -2262,11 +1908,6 @@ def test_map_column_values_decreasing_spark(spark_session):
             "include_nested": True,
         },
     )
-    results = engine.resolve_metrics(
-        metrics_to_resolve=(table_column_types,),
-        metrics=metrics,
-    )
-    metrics.update(results)
 
     condition_metric = MetricConfiguration(
         metric_name=f"column_values.decreasing.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
@@ -2294,11 +1935,6 @@ def test_map_column_values_decreasing_spark(spark_session):
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
-    metrics.update(results)
-
-    assert metrics[unexpected_count_metric.id] == 1
-
     unexpected_rows_metric = MetricConfiguration(
         metric_name=f"column_values.decreasing.{SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value}",
         metric_domain_kwargs={"column": "a"},
@@ -2310,15 +1946,18 @@ def test_map_column_values_decreasing_spark(spark_session):
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics)
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_count_metric, unexpected_rows_metric), metrics=metrics
+    )
     metrics.update(results)
 
+    assert metrics[unexpected_count_metric.id] == 1
     assert metrics[unexpected_rows_metric.id] == [(6,)]
 
 
 @pytest.mark.big
-def test_map_unique_column_exists_pd():
-    engine = build_pandas_engine(pd.DataFrame({"a": [1, 2, 3, 3, 4, None]}))
+def test_map_unique_column_exists_pd(unique_pandas_engine: PandasExecutionEngine):
+    engine = unique_pandas_engine
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -2375,9 +2014,17 @@ def test_map_unique_column_exists_pd():
     assert metrics[unexpected_rows_metric.id]["a"].values == [3]
 
 
-@pytest.mark.unit
-def test_map_unique_column_does_not_exist_pd():
-    engine = build_pandas_engine(pd.DataFrame({"a": [1, 2, 3, 3, None]}))
+@pytest.mark.parametrize(
+    "execution_engine",
+    [
+        pytest.param("unique_pandas_engine", id="pandas", marks=pytest.mark.unit),
+        pytest.param("unique_sa_engine", id="sqlite", marks=pytest.mark.sqlite),
+        pytest.param("unique_spark_engine", id="spark", marks=pytest.mark.spark),
+    ],
+    indirect=True,
+)
+def test_map_unique_column_does_not_exist(execution_engine: ExecutionEngine):
+    engine = execution_engine
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -2387,27 +2034,24 @@ def test_map_unique_column_does_not_exist_pd():
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
-    desired_metric = MetricConfiguration(
+    condition_metric = MetricConfiguration(
         metric_name=f"column_values.unique.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
         metric_domain_kwargs={"column": "non_existent_column"},
         metric_value_kwargs=None,
     )
-    desired_metric.metric_dependencies = {
+    condition_metric.metric_dependencies = {
         "table.columns": table_columns_metric,
     }
 
     with pytest.raises(gx_exceptions.MetricResolutionError) as eee:
         # noinspection PyUnusedLocal
-        results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+        results = engine.resolve_metrics(metrics_to_resolve=(condition_metric,), metrics=metrics)
     assert str(eee.value) == 'Error: The column "non_existent_column" in BatchData does not exist.'
 
 
 @pytest.mark.sqlite
-def test_map_unique_column_exists_sa(sa):
-    engine = build_sa_execution_engine(
-        pd.DataFrame({"a": [1, 2, 3, 3, None], "b": ["foo", "bar", "baz", "qux", "fish"]}),
-        sa,
-    )
+def test_map_unique_column_exists_sa(unique_sa_engine: SqlAlchemyExecutionEngine):
+    engine = unique_sa_engine
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -2428,94 +2072,64 @@ def test_map_unique_column_exists_sa(sa):
     results = engine.resolve_metrics(metrics_to_resolve=(condition_metric,), metrics=metrics)
     metrics.update(results)
 
-    desired_metric = MetricConfiguration(
+    unexpected_count_metric = MetricConfiguration(
         metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
-    desired_metric.metric_dependencies = {
+    unexpected_count_metric.metric_dependencies = {
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(
-        metrics_to_resolve=(desired_metric,),
-        metrics=metrics,  # metrics=aggregate_fn_metrics
-    )
-    metrics.update(results)
-    assert results[desired_metric.id] == 2
-
-    desired_metric = MetricConfiguration(
+    unexpected_values_metric = MetricConfiguration(
         metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value}",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs={
             "result_format": {"result_format": "BASIC", "partial_unexpected_count": 20}
         },
     )
-    desired_metric.metric_dependencies = {
+    unexpected_values_metric.metric_dependencies = {
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results[desired_metric.id] == [3, 3]
-
-    desired_metric = MetricConfiguration(
+    unexpected_value_counts_metric = MetricConfiguration(
         metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_VALUE_COUNTS.value}",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs={
             "result_format": {"result_format": "BASIC", "partial_unexpected_count": 20}
         },
     )
-    desired_metric.metric_dependencies = {
+    unexpected_value_counts_metric.metric_dependencies = {
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    assert results[desired_metric.id] == [(3, 2)]
-
-    desired_metric = MetricConfiguration(
+    unexpected_rows_metric = MetricConfiguration(
         metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value}",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs={
             "result_format": {"result_format": "BASIC", "partial_unexpected_count": 20}
         },
     )
-    desired_metric.metric_dependencies = {
+    unexpected_rows_metric.metric_dependencies = {
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results[desired_metric.id] == [(3, "baz"), (3, "qux")]
-
-
-@pytest.mark.sqlite
-def test_map_unique_column_does_not_exist_sa(sa):
-    engine = build_sa_execution_engine(
-        pd.DataFrame({"a": [1, 2, 3, 3, None], "b": ["foo", "bar", "baz", "qux", "fish"]}),
-        sa,
-    )
-
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-    table_columns_metric: MetricConfiguration
-    results: Dict[Tuple[str, str, str], MetricValue]
-
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
 
-    condition_metric = MetricConfiguration(
-        metric_name=f"column_values.unique.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
-        metric_domain_kwargs={"column": "non_existent_column"},
-        metric_value_kwargs=None,
+    # The summarization metrics depend only on the already resolved condition, so they are
+    # resolved in a single pass.
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            unexpected_count_metric,
+            unexpected_values_metric,
+            unexpected_value_counts_metric,
+            unexpected_rows_metric,
+        ),
+        metrics=metrics,
     )
-    condition_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-    with pytest.raises(gx_exceptions.MetricResolutionError) as eee:
-        # noinspection PyUnusedLocal
-        metrics = engine.resolve_metrics(metrics_to_resolve=(condition_metric,), metrics=metrics)
-    assert 'Error: The column "non_existent_column" in BatchData does not exist.' in str(eee.value)
+    assert results[unexpected_count_metric.id] == 2
+    assert results[unexpected_values_metric.id] == [3, 3]
+    assert results[unexpected_value_counts_metric.id] == [(3, 2)]
+    assert results[unexpected_rows_metric.id] == [(3, "baz"), (3, "qux")]
 
 
 @pytest.mark.sqlite
@@ -2558,17 +2172,8 @@ def test_map_unique_empty_query_sa(sa):
 
 
 @pytest.mark.spark
-def test_map_unique_column_exists_spark(spark_session):
-    engine: SparkDFExecutionEngine = build_spark_engine(
-        spark=spark_session,
-        df=pd.DataFrame(
-            {
-                "a": [1, 2, 3, 3, 4, None],
-                "b": [None, "foo", "bar", "baz", "qux", "fish"],
-            }
-        ),
-        batch_id="my_id",
-    )
+def test_map_unique_column_exists_spark(unique_spark_engine: SparkDFExecutionEngine):
+    engine = unique_spark_engine
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
@@ -2590,100 +2195,63 @@ def test_map_unique_column_exists_spark(spark_session):
     metrics.update(results)
 
     # unique is a *window* function so does not use the aggregate_fn version of unexpected count
-    desired_metric = MetricConfiguration(
+    unexpected_count_metric = MetricConfiguration(
         metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
-    desired_metric.metric_dependencies = {
+    unexpected_count_metric.metric_dependencies = {
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results[desired_metric.id] == 2
-
-    desired_metric = MetricConfiguration(
+    unexpected_values_metric = MetricConfiguration(
         metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value}",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs={
             "result_format": {"result_format": "BASIC", "partial_unexpected_count": 20}
         },
     )
-    desired_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results[desired_metric.id] == [3, 3]
-
-    desired_metric = MetricConfiguration(
-        metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_VALUE_COUNTS.value}",
-        metric_domain_kwargs={"column": "a"},
-        metric_value_kwargs={
-            "result_format": {"result_format": "BASIC", "partial_unexpected_count": 20}
-        },
-    )
-    desired_metric.metric_dependencies = {
+    unexpected_values_metric.metric_dependencies = {
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results[desired_metric.id] == [(3, 2)]
-
-    desired_metric = MetricConfiguration(
-        metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value}",
-        metric_domain_kwargs={
-            "column": "a",
-        },
-        metric_value_kwargs={
-            "result_format": {"result_format": "BASIC", "partial_unexpected_count": 20}
-        },
-    )
-    desired_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
-    assert results[desired_metric.id] == [(3, "bar"), (3, "baz")]
-
-
-@pytest.mark.spark
-def test_map_unique_column_does_not_exist_spark(spark_session):
-    engine: SparkDFExecutionEngine = build_spark_engine(
-        spark=spark_session,
-        df=pd.DataFrame(
-            {
-                "a": [1, 2, 3, 3, 4, None],
-                "b": [None, "foo", "bar", "baz", "qux", "fish"],
-            }
-        ),
-        batch_id="my_id",
-    )
-
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-    table_columns_metric: MetricConfiguration
-    results: Dict[Tuple[str, str, str], MetricValue]
-
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
-
-    condition_metric = MetricConfiguration(
-        metric_name=f"column_values.unique.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
-        metric_domain_kwargs={"column": "non_existent_column"},
-        metric_value_kwargs=None,
+    unexpected_value_counts_metric = MetricConfiguration(
+        metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_VALUE_COUNTS.value}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "result_format": {"result_format": "BASIC", "partial_unexpected_count": 20}
+        },
     )
-    condition_metric.metric_dependencies = {
+    unexpected_value_counts_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
+    unexpected_rows_metric = MetricConfiguration(
+        metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "result_format": {"result_format": "BASIC", "partial_unexpected_count": 20}
+        },
+    )
+    unexpected_rows_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+    }
 
-    with pytest.raises(gx_exceptions.MetricResolutionError) as eee:
-        # noinspection PyUnusedLocal
-        metrics = engine.resolve_metrics(metrics_to_resolve=(condition_metric,), metrics=metrics)
-    assert str(eee.value) == 'Error: The column "non_existent_column" in BatchData does not exist.'
+    # The summarization metrics depend only on the already resolved condition, so they are
+    # resolved in a single pass.
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            unexpected_count_metric,
+            unexpected_values_metric,
+            unexpected_value_counts_metric,
+            unexpected_rows_metric,
+        ),
+        metrics=metrics,
+    )
+    assert results[unexpected_count_metric.id] == 2
+    assert results[unexpected_values_metric.id] == [3, 3]
+    assert results[unexpected_value_counts_metric.id] == [(3, 2)]
+    assert results[unexpected_rows_metric.id] == [(3, "bar"), (3, "baz")]
 
 
 @pytest.mark.big
@@ -2820,7 +2388,6 @@ def test_z_score_under_threshold_spark(spark_session):
     )
     stdev.metric_dependencies = {
         "metric_partial_fn": column_standard_deviation_aggregate_fn_metric,
-        "table.columns": table_columns_metric,
     }
     desired_metrics = (mean, stdev)
     results = engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
@@ -2885,253 +2452,15 @@ def test_table_metric_pd(caplog):
         metric_value_kwargs=None,
     )
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
-    assert results == {desired_metric.id: 5}
-    assert (
-        'Unexpected key(s) "column" found in domain_kwargs for Domain type "table"' in caplog.text
-    )
-
-
-@pytest.mark.big
-def test_map_column_pairs_equal_metric_pd():  # noqa: PLR0915
-    engine = build_pandas_engine(
-        pd.DataFrame(
-            data={
-                "a": [0, 1, 9, 2],
-                "b": [5, 4, 3, 6],
-                "c": [5, 4, 3, 6],
-                "d": [7, 8, 9, 0],
-            }
-        )
-    )
-
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-    table_columns_metric: MetricConfiguration
-    results: Dict[Tuple[str, str, str], MetricValue]
-
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
-
-    """
-    Two tests:
-    1. Pass -- no unexpected rows.
-    2. Fail -- one or more unexpected rows.
-    """
-
-    # Save original metrics for testing unexpected results.
-    metrics_save: dict = copy.deepcopy(metrics)
-
-    metric_name: str = "column_pair_values.equal"
-    condition_metric_name: str = (
-        f"{metric_name}.{MetricPartialFunctionTypeSuffixes.CONDITION.value}"
-    )
-    unexpected_count_metric_name: str = (
-        f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}"
-    )
-    unexpected_rows_metric_name: str = (
-        f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value}"
-    )
-    unexpected_values_metric_name: str = (
-        f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value}"
-    )
-
-    # First, assert Pass (no unexpected results).
-
-    condition_metric = MetricConfiguration(
-        metric_name=condition_metric_name,
-        metric_domain_kwargs={
-            "column_A": "b",
-            "column_B": "c",
-        },
-        metric_value_kwargs=None,
-    )
-    condition_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(
-        metrics_to_resolve=(condition_metric,),
-        metrics=metrics,
-    )
-    metrics.update(results)
-
-    unexpected_count_metric = MetricConfiguration(
-        metric_name=unexpected_count_metric_name,
-        metric_domain_kwargs={
-            "column_A": "b",
-            "column_B": "c",
-        },
-        metric_value_kwargs=None,
-    )
-    unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
-    metrics.update(results)
-
-    # Condition metrics return "negative logic" series.
-    assert list(metrics[condition_metric.id][0]) == [False, False, False, False]
-    assert metrics[unexpected_count_metric.id] == 0
-
-    unexpected_rows_metric = MetricConfiguration(
-        metric_name=unexpected_rows_metric_name,
-        metric_domain_kwargs={
-            "column_A": "b",
-            "column_B": "c",
-        },
-        metric_value_kwargs={
-            "result_format": {"result_format": "SUMMARY", "partial_unexpected_count": 3}
-        },
-    )
-    unexpected_rows_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics)
-    metrics.update(results)
-
-    assert metrics[unexpected_rows_metric.id].empty
-    assert len(metrics[unexpected_rows_metric.id].columns) == 4
-
-    unexpected_values_metric = MetricConfiguration(
-        metric_name=unexpected_values_metric_name,
-        metric_domain_kwargs={
-            "column_A": "b",
-            "column_B": "c",
-        },
-        metric_value_kwargs={
-            "result_format": {"result_format": "SUMMARY", "partial_unexpected_count": 3}
-        },
-    )
-    unexpected_values_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(
-        metrics_to_resolve=(unexpected_values_metric,), metrics=metrics
-    )
-    metrics.update(results)
-
-    assert len(metrics[unexpected_values_metric.id]) == 0
-    assert metrics[unexpected_values_metric.id] == []
-
-    # Restore from saved original metrics in order to start fresh on testing for unexpected results.
-    metrics = copy.deepcopy(metrics_save)
-
-    # Second, assert Fail (one or more unexpected results).
-
-    condition_metric = MetricConfiguration(
-        metric_name=condition_metric_name,
-        metric_domain_kwargs={
-            "column_A": "a",
-            "column_B": "d",
-        },
-        metric_value_kwargs=None,
-    )
-    condition_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(
-        metrics_to_resolve=(condition_metric,),
-        metrics=metrics,
-    )
-    metrics.update(results)
-
-    unexpected_count_metric = MetricConfiguration(
-        metric_name=unexpected_count_metric_name,
-        metric_domain_kwargs={
-            "column_A": "a",
-            "column_B": "d",
-        },
-        metric_value_kwargs=None,
-    )
-    unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
-    metrics.update(results)
-
-    # Condition metrics return "negative logic" series.
-    assert list(metrics[condition_metric.id][0]) == [True, True, False, True]
-    assert metrics[unexpected_count_metric.id] == 3
-
-    unexpected_rows_metric = MetricConfiguration(
-        metric_name=unexpected_rows_metric_name,
-        metric_domain_kwargs={
-            "column_A": "a",
-            "column_B": "d",
-        },
-        metric_value_kwargs={
-            "result_format": {"result_format": "SUMMARY", "partial_unexpected_count": 3}
-        },
-    )
-    unexpected_rows_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics)
-    metrics.update(results)
-
-    assert metrics[unexpected_rows_metric.id].equals(
-        pd.DataFrame(
-            data={"a": [0, 1, 2], "b": [5, 4, 6], "c": [5, 4, 6], "d": [7, 8, 0]},
-            index=pd.Index([0, 1, 3]),
-        )
-    )
-    assert len(metrics[unexpected_rows_metric.id].columns) == 4
-    pd.testing.assert_index_equal(metrics[unexpected_rows_metric.id].index, pd.Index([0, 1, 3]))
-
-    unexpected_values_metric = MetricConfiguration(
-        metric_name=unexpected_values_metric_name,
-        metric_domain_kwargs={
-            "column_A": "a",
-            "column_B": "d",
-        },
-        metric_value_kwargs={
-            "result_format": {"result_format": "SUMMARY", "partial_unexpected_count": 3}
-        },
-    )
-    unexpected_values_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(
-        metrics_to_resolve=(unexpected_values_metric,), metrics=metrics
-    )
-    metrics.update(results)
-
-    assert len(metrics[unexpected_values_metric.id]) == 3
-    assert metrics[unexpected_values_metric.id] == [(0, 7), (1, 8), (2, 0)]
-
-
-@pytest.mark.sqlite
-def test_table_metric_sa(sa):
-    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 1, 2, 3, 3]}), sa)
-
-    aggregate_fn_metric = MetricConfiguration(
-        metric_name=f"table.row_count.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
-        metric_domain_kwargs={},
-        metric_value_kwargs=None,
-    )
-    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,))
-
-    desired_metric = MetricConfiguration(
-        metric_name="table.row_count",
-        metric_domain_kwargs={},
-        metric_value_kwargs=None,
+    assert results == {desired_metric.id: 5}
+    assert (
+        'Unexpected key(s) "column" found in domain_kwargs for Domain type "table"' in caplog.text
     )
-    desired_metric.metric_dependencies = {
-        "metric_partial_fn": aggregate_fn_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=results)
-
-    assert results == {desired_metric.id: 6}
 
 
-@pytest.mark.sqlite
-def test_map_column_pairs_equal_metric_sa(sa):  # noqa: PLR0915
-    engine = build_sa_execution_engine(
+@pytest.mark.big
+def test_map_column_pairs_equal_metric_pd():
+    engine = build_pandas_engine(
         pd.DataFrame(
             data={
                 "a": [0, 1, 9, 2],
@@ -3139,8 +2468,7 @@ def test_map_column_pairs_equal_metric_sa(sa):  # noqa: PLR0915
                 "c": [5, 4, 3, 6],
                 "d": [7, 8, 9, 0],
             }
-        ),
-        sa,
+        )
     )
 
     metrics: Dict[Tuple[str, str, str], MetricValue] = {}
@@ -3158,7 +2486,7 @@ def test_map_column_pairs_equal_metric_sa(sa):  # noqa: PLR0915
     """
 
     # Save original metrics for testing unexpected results.
-    metrics_save: dict = copy.deepcopy(metrics)
+    metrics_save: dict = dict(metrics)
 
     metric_name: str = "column_pair_values.equal"
     condition_metric_name: str = (
@@ -3205,11 +2533,6 @@ def test_map_column_pairs_equal_metric_sa(sa):  # noqa: PLR0915
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
-    metrics.update(results)
-
-    assert metrics[unexpected_count_metric.id] == 0
-
     unexpected_rows_metric = MetricConfiguration(
         metric_name=unexpected_rows_metric_name,
         metric_domain_kwargs={
@@ -3224,11 +2547,6 @@ def test_map_column_pairs_equal_metric_sa(sa):  # noqa: PLR0915
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics)
-    metrics.update(results)
-
-    assert len(metrics[unexpected_rows_metric.id]) == 0
-
     unexpected_values_metric = MetricConfiguration(
         metric_name=unexpected_values_metric_name,
         metric_domain_kwargs={
@@ -3244,15 +2562,25 @@ def test_map_column_pairs_equal_metric_sa(sa):  # noqa: PLR0915
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
-        metrics_to_resolve=(unexpected_values_metric,), metrics=metrics
+        metrics_to_resolve=(
+            unexpected_count_metric,
+            unexpected_rows_metric,
+            unexpected_values_metric,
+        ),
+        metrics=metrics,
     )
     metrics.update(results)
 
+    # Condition metrics return "negative logic" series.
+    assert list(metrics[condition_metric.id][0]) == [False, False, False, False]
+    assert metrics[unexpected_count_metric.id] == 0
+    assert metrics[unexpected_rows_metric.id].empty
+    assert len(metrics[unexpected_rows_metric.id].columns) == 4
     assert len(metrics[unexpected_values_metric.id]) == 0
     assert metrics[unexpected_values_metric.id] == []
 
     # Restore from saved original metrics in order to start fresh on testing for unexpected results.
-    metrics = copy.deepcopy(metrics_save)
+    metrics = dict(metrics_save)
 
     # Second, assert Fail (one or more unexpected results).
 
@@ -3285,11 +2613,6 @@ def test_map_column_pairs_equal_metric_sa(sa):  # noqa: PLR0915
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
-    metrics.update(results)
-
-    assert metrics[unexpected_count_metric.id] == 3
-
     unexpected_rows_metric = MetricConfiguration(
         metric_name=unexpected_rows_metric_name,
         metric_domain_kwargs={
@@ -3304,15 +2627,6 @@ def test_map_column_pairs_equal_metric_sa(sa):  # noqa: PLR0915
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics)
-    metrics.update(results)
-
-    assert metrics[unexpected_rows_metric.id] == [
-        (0, 5, 5, 7),
-        (1, 4, 4, 8),
-        (2, 6, 6, 0),
-    ]
-
     unexpected_values_metric = MetricConfiguration(
         metric_name=unexpected_values_metric_name,
         metric_domain_kwargs={
@@ -3328,149 +2642,100 @@ def test_map_column_pairs_equal_metric_sa(sa):  # noqa: PLR0915
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
-        metrics_to_resolve=(unexpected_values_metric,), metrics=metrics
+        metrics_to_resolve=(
+            unexpected_count_metric,
+            unexpected_rows_metric,
+            unexpected_values_metric,
+        ),
+        metrics=metrics,
     )
     metrics.update(results)
 
-    assert len(metrics[unexpected_values_metric.id]) == 3
-    assert metrics[unexpected_values_metric.id] == [(0, 7), (1, 8), (2, 0)]
-
-
-@pytest.mark.spark
-def test_map_column_pairs_equal_metric_spark(spark_session):  # noqa: PLR0915
-    engine: SparkDFExecutionEngine = build_spark_engine(
-        spark=spark_session,
-        df=pd.DataFrame(
-            data={
-                "a": [0, 1, 9, 2],
-                "b": [5, 4, 3, 6],
-                "c": [5, 4, 3, 6],
-                "d": [7, 8, 9, 0],
-            }
+    # Condition metrics return "negative logic" series.
+    assert list(metrics[condition_metric.id][0]) == [True, True, False, True]
+    assert metrics[unexpected_count_metric.id] == 3
+    pd.testing.assert_frame_equal(
+        metrics[unexpected_rows_metric.id],
+        pd.DataFrame(
+            data={"a": [0, 1, 2], "b": [5, 4, 6], "c": [5, 4, 6], "d": [7, 8, 0]},
+            index=pd.Index([0, 1, 3]),
         ),
-        batch_id="my_id",
     )
+    assert len(metrics[unexpected_values_metric.id]) == 3
+    assert metrics[unexpected_values_metric.id] == [(0, 7), (1, 8), (2, 0)]
 
-    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-    table_columns_metric: MetricConfiguration
-    results: Dict[Tuple[str, str, str], MetricValue]
-
-    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
-    metrics.update(results)
-
-    """
-    Two tests:
-    1. Pass -- no unexpected rows.
-    2. Fail -- one or more unexpected rows.
-    """
-
-    # Save original metrics for testing unexpected results.
-    metrics_save: dict = copy.deepcopy(metrics)
-
-    metric_name: str = "column_pair_values.equal"
-    condition_metric_name: str = (
-        f"{metric_name}.{MetricPartialFunctionTypeSuffixes.CONDITION.value}"
-    )
-    unexpected_count_metric_name: str = (
-        f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}"
-    )
-    unexpected_rows_metric_name: str = (
-        f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value}"
-    )
-    unexpected_values_metric_name: str = (
-        f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value}"
-    )
 
-    # First, assert Pass (no unexpected results).
+@pytest.mark.sqlite
+def test_table_metric_sa(sa):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 1, 2, 3, 3]}), sa)
 
-    condition_metric = MetricConfiguration(
-        metric_name=condition_metric_name,
-        metric_domain_kwargs={
-            "column_A": "b",
-            "column_B": "c",
-        },
+    aggregate_fn_metric = MetricConfiguration(
+        metric_name=f"table.row_count.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={},
         metric_value_kwargs=None,
     )
-    condition_metric.metric_dependencies = {
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(
-        metrics_to_resolve=(condition_metric,),
-        metrics=metrics,
-    )
-    metrics.update(results)
+    results = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn_metric,))
 
-    unexpected_count_metric = MetricConfiguration(
-        metric_name=unexpected_count_metric_name,
-        metric_domain_kwargs={
-            "column_A": "b",
-            "column_B": "c",
-        },
+    desired_metric = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={},
         metric_value_kwargs=None,
     )
-    unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
-        "table.columns": table_columns_metric,
+    desired_metric.metric_dependencies = {
+        "metric_partial_fn": aggregate_fn_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
-    metrics.update(results)
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=results)
 
-    # Condition metrics return "negative logic" series.
-    assert metrics[unexpected_count_metric.id] == 0
+    assert results == {desired_metric.id: 6}
 
-    unexpected_rows_metric = MetricConfiguration(
-        metric_name=unexpected_rows_metric_name,
-        metric_domain_kwargs={
-            "column_A": "b",
-            "column_B": "c",
-        },
-        metric_value_kwargs={
-            "result_format": {"result_format": "SUMMARY", "partial_unexpected_count": 3}
-        },
-    )
-    unexpected_rows_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics)
-    metrics.update(results)
 
-    assert len(metrics[unexpected_rows_metric.id]) == 0
+@pytest.mark.parametrize(
+    "column_A,column_B,expected_unexpected_rows,expected_unexpected_values",
+    [
+        pytest.param("b", "c", [], [], id="pass"),
+        pytest.param(
+            "a",
+            "d",
+            [(0, 5, 5, 7), (1, 4, 4, 8), (2, 6, 6, 0)],
+            [(0, 7), (1, 8), (2, 0)],
+            id="fail",
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "execution_engine",
+    [
+        pytest.param("column_pairs_equal_sa_engine", id="sqlite", marks=pytest.mark.sqlite),
+        pytest.param("column_pairs_equal_spark_engine", id="spark", marks=pytest.mark.spark),
+    ],
+    indirect=True,
+)
+def test_map_column_pairs_equal_metric(
+    execution_engine: ExecutionEngine,
+    column_A: str,
+    column_B: str,
+    expected_unexpected_rows: list,
+    expected_unexpected_values: list,
+):
+    engine = execution_engine
 
-    unexpected_values_metric = MetricConfiguration(
-        metric_name=unexpected_values_metric_name,
-        metric_domain_kwargs={
-            "column_A": "b",
-            "column_B": "c",
-        },
-        metric_value_kwargs={
-            "result_format": {"result_format": "SUMMARY", "partial_unexpected_count": 3}
-        },
-    )
-    unexpected_values_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
-        "table.columns": table_columns_metric,
-    }
-    results = engine.resolve_metrics(
-        metrics_to_resolve=(unexpected_values_metric,), metrics=metrics
-    )
-    metrics.update(results)
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
-    assert len(metrics[unexpected_values_metric.id]) == 0
-    assert metrics[unexpected_values_metric.id] == []
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
 
-    # Restore from saved original metrics in order to start fresh on testing for unexpected results.
-    metrics = copy.deepcopy(metrics_save)
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
 
-    # Second, assert Fail (one or more unexpected results).
+    metric_name: str = "column_pair_values.equal"
+    metric_domain_kwargs: dict = {
+        "column_A": column_A,
+        "column_B": column_B,
+    }
 
     condition_metric = MetricConfiguration(
-        metric_name=condition_metric_name,
-        metric_domain_kwargs={
-            "column_A": "a",
-            "column_B": "d",
-        },
+        metric_name=f"{metric_name}.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+        metric_domain_kwargs=metric_domain_kwargs,
         metric_value_kwargs=None,
     )
     condition_metric.metric_dependencies = {
@@ -3483,29 +2748,17 @@ def test_map_column_pairs_equal_metric_spark(spark_session):  # noqa: PLR0915
     metrics.update(results)
 
     unexpected_count_metric = MetricConfiguration(
-        metric_name=unexpected_count_metric_name,
-        metric_domain_kwargs={
-            "column_A": "a",
-            "column_B": "d",
-        },
+        metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+        metric_domain_kwargs=metric_domain_kwargs,
         metric_value_kwargs=None,
     )
     unexpected_count_metric.metric_dependencies = {
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
-    metrics.update(results)
-
-    # Condition metrics return "negative logic" series.
-    assert metrics[unexpected_count_metric.id] == 3
-
     unexpected_rows_metric = MetricConfiguration(
-        metric_name=unexpected_rows_metric_name,
-        metric_domain_kwargs={
-            "column_A": "a",
-            "column_B": "d",
-        },
+        metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value}",
+        metric_domain_kwargs=metric_domain_kwargs,
         metric_value_kwargs={
             "result_format": {"result_format": "SUMMARY", "partial_unexpected_count": 3}
         },
@@ -3514,21 +2767,9 @@ def test_map_column_pairs_equal_metric_spark(spark_session):  # noqa: PLR0915
         "unexpected_condition": condition_metric,
         "table.columns": table_columns_metric,
     }
-    results = engine.resolve_metrics(metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics)
-    metrics.update(results)
-
-    assert metrics[unexpected_rows_metric.id] == [
-        (0, 5, 5, 7),
-        (1, 4, 4, 8),
-        (2, 6, 6, 0),
-    ]
-
     unexpected_values_metric = MetricConfiguration(
-        metric_name=unexpected_values_metric_name,
-        metric_domain_kwargs={
-            "column_A": "a",
-            "column_B": "d",
-        },
+        metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value}",
+        metric_domain_kwargs=metric_domain_kwargs,
         metric_value_kwargs={
             "result_format": {"result_format": "SUMMARY", "partial_unexpected_count": 3}
         },
@@ -3538,12 +2779,18 @@ def test_map_column_pairs_equal_metric_spark(spark_session):  # noqa: PLR0915
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
-        metrics_to_resolve=(unexpected_values_metric,), metrics=metrics
+        metrics_to_resolve=(
+            unexpected_count_metric,
+            unexpected_rows_metric,
+            unexpected_values_metric,
+        ),
+        metrics=metrics,
     )
     metrics.update(results)
 
-    assert len(metrics[unexpected_values_metric.id]) == 3
-    assert metrics[unexpected_values_metric.id] == [(0, 7), (1, 8), (2, 0)]
+    assert metrics[unexpected_count_metric.id] == len(expected_unexpected_rows)
+    assert metrics[unexpected_rows_metric.id] == expected_unexpected_rows
+    assert metrics[unexpected_values_metric.id] == expected_unexpected_values
 
 
 @pytest.mark.big
@@ -3793,7 +3040,6 @@ def test_map_column_pairs_in_set_metric_pd():
         metrics_to_resolve=(condition_metric,),
         metrics=metrics,
     )
-    metrics.update(results)
 
     assert (
         results[condition_metric.id][0]
@@ -3915,7 +3161,6 @@ def test_map_column_pairs_in_set_metric_sa(sa):
         metrics_to_resolve=(unexpected_values_metric,),
         metrics=metrics,
     )
-    metrics.update(results)
 
     assert results[unexpected_values_metric.id] == [
         (10.0, 1.0),
@@ -4038,7 +3283,6 @@ def test_map_column_pairs_in_set_metric_spark(spark_session):
         metrics_to_resolve=(unexpected_values_metric,),
         metrics=metrics,
     )
-    metrics.update(results)
 
     assert results[unexpected_values_metric.id] == [
         (10.0, 1.0),
@@ -4102,7 +3346,6 @@ def test_column_median_metric_pd():
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
     assert results == {desired_metric.id: 2}
 
 
@@ -4175,7 +3418,6 @@ def test_column_median_metric_sa(sa, dataframe: pd.DataFrame, median: int):
     column_values_nonnull_count_metric.metric_dependencies = {
         "unexpected_condition": column_values_null_condition_metric,
         "metric_partial_fn": partial_metric,
-        "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
         metrics_to_resolve=(column_values_nonnull_count_metric,), metrics=metrics
@@ -4193,7 +3435,6 @@ def test_column_median_metric_sa(sa, dataframe: pd.DataFrame, median: int):
         "column_values.nonnull.count": column_values_nonnull_count_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
-    metrics.update(results)
     assert results == {desired_metric.id: median}
 
 
@@ -4648,7 +3889,6 @@ def test_batch_aggregate_metrics_pd():
         ),
         metrics=metrics,
     )
-    metrics.update(results)
     end = datetime.datetime.now()  # noqa: DTZ005
     print(end - start)
     assert results[desired_metric_1.id] == "2021-06-18"
@@ -4723,7 +3963,6 @@ def test_batch_aggregate_metrics_sa(caplog, sa):
     )
     desired_metric_1.metric_dependencies = {
         "metric_partial_fn": desired_aggregate_fn_metric_1,
-        "table.columns": table_columns_metric,
     }
     desired_metric_2 = MetricConfiguration(
         metric_name="column.min",
@@ -4732,7 +3971,6 @@ def test_batch_aggregate_metrics_sa(caplog, sa):
     )
     desired_metric_2.metric_dependencies = {
         "metric_partial_fn": desired_aggregate_fn_metric_2,
-        "table.columns": table_columns_metric,
     }
     desired_metric_3 = MetricConfiguration(
         metric_name="column.max",
@@ -4741,7 +3979,6 @@ def test_batch_aggregate_metrics_sa(caplog, sa):
     )
     desired_metric_3.metric_dependencies = {
         "metric_partial_fn": desired_aggregate_fn_metric_3,
-        "table.columns": table_columns_metric,
     }
     desired_metric_4 = MetricConfiguration(
         metric_name="column.min",
@@ -4750,7 +3987,6 @@ def test_batch_aggregate_metrics_sa(caplog, sa):
     )
     desired_metric_4.metric_dependencies = {
         "metric_partial_fn": desired_aggregate_fn_metric_4,
-        "table.columns": table_columns_metric,
     }
     caplog.clear()
     caplog.set_level(logging.DEBUG, logger="great_expectations")
@@ -4925,7 +4161,7 @@ def test_map_multicolumn_sum_equal_pd():  # noqa: PLR0915
     """
 
     # Save original metrics for testing unexpected results.
-    metrics_save: dict = copy.deepcopy(metrics)
+    metrics_save: dict = dict(metrics)
 
     metric_name: str = "multicolumn_sum.equal"
     condition_metric_name: str = (
@@ -5020,7 +4256,7 @@ def test_map_multicolumn_sum_equal_pd():  # noqa: PLR0915
     assert metrics[unexpected_values_metric.id] == []
 
     # Restore from saved original metrics in order to start fresh on testing for unexpected results.
-    metrics = copy.deepcopy(metrics_save)
+    metrics = dict(metrics_save)
 
     # Second, assert Fail (one or more unexpected results).
 
@@ -5076,11 +4312,10 @@ def test_map_multicolumn_sum_equal_pd():  # noqa: PLR0915
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics)
     metrics.update(results)
 
-    assert metrics[unexpected_rows_metric.id].equals(
-        pd.DataFrame(data={"a": [2], "b": [3], "c": [1], "d": [9]}, index=[2])
+    pd.testing.assert_frame_equal(
+        metrics[unexpected_rows_metric.id],
+        pd.DataFrame(data={"a": [2], "b": [3], "c": [1], "d": [9]}, index=[2]),
     )
-    assert len(metrics[unexpected_rows_metric.id].columns) == 4
-    pd.testing.assert_index_equal(metrics[unexpected_rows_metric.id].index, pd.Index([2]))
 
     unexpected_values_metric = MetricConfiguration(
         metric_name=unexpected_values_metric_name,
@@ -5126,7 +4361,7 @@ def test_map_multicolumn_sum_equal_sa(sa):  # noqa: PLR0915
     """
 
     # Save original metrics for testing unexpected results.
-    metrics_save: dict = copy.deepcopy(metrics)
+    metrics_save: dict = dict(metrics)
 
     metric_name: str = "multicolumn_sum.equal"
     condition_metric_name: str = (
@@ -5217,7 +4452,7 @@ def test_map_multicolumn_sum_equal_sa(sa):  # noqa: PLR0915
     assert metrics[unexpected_values_metric.id] == []
 
     # Restore from saved original metrics in order to start fresh on testing for unexpected results.
-    metrics = copy.deepcopy(metrics_save)
+    metrics = dict(metrics_save)
 
     # Second, assert Fail (one or more unexpected results).
 
@@ -5319,7 +4554,7 @@ def test_map_multicolumn_sum_equal_spark(spark_session):  # noqa: PLR0915
     """
 
     # Save original metrics for testing unexpected results.
-    metrics_save: dict = copy.deepcopy(metrics)
+    metrics_save: dict = dict(metrics)
 
     metric_name: str = "multicolumn_sum.equal"
     condition_metric_name: str = (
@@ -5411,7 +4646,7 @@ def test_map_multicolumn_sum_equal_spark(spark_session):  # noqa: PLR0915
     assert metrics[unexpected_values_metric.id] == []
 
     # Restore from saved original metrics in order to start fresh on testing for unexpected results.
-    metrics = copy.deepcopy(metrics_save)
+    metrics = dict(metrics_save)
 
     # Second, assert Fail (one or more unexpected results).
 
@@ -5512,7 +4747,7 @@ def test_map_compound_columns_unique_pd():  # noqa: PLR0915
     """
 
     # Save original metrics for testing unexpected results.
-    metrics_save: dict = copy.deepcopy(metrics)
+    metrics_save: dict = dict(metrics)
 
     metric_name: str = "compound_columns.unique"
     condition_metric_name: str = (
@@ -5605,7 +4840,7 @@ def test_map_compound_columns_unique_pd():  # noqa: PLR0915
     assert metrics[unexpected_values_metric.id] == []
 
     # Restore from saved original metrics in order to start fresh on testing for unexpected results.
-    metrics = copy.deepcopy(metrics_save)
+    metrics = dict(metrics_save)
 
     # Second, assert Fail (one or more unexpected results).
 
@@ -5659,11 +4894,10 @@ def test_map_compound_columns_unique_pd():  # noqa: PLR0915
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics)
     metrics.update(results)
 
-    assert metrics[unexpected_rows_metric.id].equals(
-        pd.DataFrame(data={"a": [1, 1], "b": [2, 3], "c": [2, 2]}, index=[1, 2])
+    pd.testing.assert_frame_equal(
+        metrics[unexpected_rows_metric.id],
+        pd.DataFrame(data={"a": [1, 1], "b": [2, 3], "c": [2, 2]}, index=[1, 2]),
     )
-    assert len(metrics[unexpected_rows_metric.id].columns) == 3
-    pd.testing.assert_index_equal(metrics[unexpected_rows_metric.id].index, pd.Index([1, 2]))
 
     unexpected_values_metric = MetricConfiguration(
         metric_name=unexpected_values_metric_name,
@@ -5709,7 +4943,7 @@ def test_map_compound_columns_unique_sa(sa):  # noqa: PLR0915
     """
 
     # Save original metrics for testing unexpected results.
-    metrics_save: dict = copy.deepcopy(metrics)
+    metrics_save: dict = dict(metrics)
 
     prerequisite_function_metric_name: str = (
         f"compound_columns.count.{MetricPartialFunctionTypeSuffixes.MAP.value}"
@@ -5820,7 +5054,7 @@ def test_map_compound_columns_unique_sa(sa):  # noqa: PLR0915
     assert len(metrics[unexpected_values_metric.id]) == 0
 
     # Restore from saved original metrics in order to start fresh on testing for unexpected results.
-    metrics = copy.deepcopy(metrics_save)
+    metrics = dict(metrics_save)
 
     # Second, assert Fail (one or more unexpected results).
 
@@ -5937,7 +5171,7 @@ def test_map_compound_columns_unique_spark(spark_session):  # noqa: PLR0915
     """
 
     # Save original metrics for testing unexpected results.
-    metrics_save: dict = copy.deepcopy(metrics)
+    metrics_save: dict = dict(metrics)
 
     metric_name: str = "compound_columns.unique"
     condition_metric_name: str = (
@@ -6028,7 +5262,7 @@ def test_map_compound_columns_unique_spark(spark_session):  # noqa: PLR0915
     assert metrics[unexpected_values_metric.id] == []
 
     # Restore from saved original metrics in order to start fresh on testing for unexpected results.
-    metrics = copy.deepcopy(metrics_save)
+    metrics = dict(metrics_save)
 
     # Second, assert Fail (one or more unexpected results).
 
@@ -6126,7 +5360,7 @@ def test_map_select_column_values_unique_within_record_pd():  # noqa: PLR0915
     metrics.update(results)
 
     # Save original metrics for testing unexpected results.
-    metrics_save: dict = copy.deepcopy(metrics)
+    metrics_save: dict = dict(metrics)
 
     metric_name: str = "select_column_values.unique.within_record"
     condition_metric_name: str = (
@@ -6203,14 +5437,13 @@ def test_map_select_column_values_unique_within_record_pd():  # noqa: PLR0915
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics)
     metrics.update(results)
 
-    assert metrics[unexpected_rows_metric.id].equals(
+    pd.testing.assert_frame_equal(
+        metrics[unexpected_rows_metric.id],
         pd.DataFrame(
             data={"a": [1.0, 4.0, None], "b": [1.0, 4.0, None], "c": [2.0, 4.0, 9.0]},
             index=[0, 4, 6],
-        )
+        ),
     )
-    assert len(metrics[unexpected_rows_metric.id].columns) == 3
-    pd.testing.assert_index_equal(metrics[unexpected_rows_metric.id].index, pd.Index([0, 4, 6]))
 
     unexpected_values_metric = MetricConfiguration(
         metric_name=unexpected_values_metric_name,
@@ -6248,7 +5481,7 @@ def test_map_select_column_values_unique_within_record_pd():  # noqa: PLR0915
     ]
 
     # Restore from saved original metrics in order to start fresh on testing for unexpected results.
-    metrics = copy.deepcopy(metrics_save)
+    metrics = dict(metrics_save)
 
     condition_metric = MetricConfiguration(
         metric_name=condition_metric_name,
@@ -6310,11 +5543,10 @@ def test_map_select_column_values_unique_within_record_pd():  # noqa: PLR0915
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics)
     metrics.update(results)
 
-    assert metrics[unexpected_rows_metric.id].equals(
-        pd.DataFrame(data={"a": [1.0, 4.0], "b": [1.0, 4.0], "c": [2.0, 4.0]}, index=[0, 4])
+    pd.testing.assert_frame_equal(
+        metrics[unexpected_rows_metric.id],
+        pd.DataFrame(data={"a": [1.0, 4.0], "b": [1.0, 4.0], "c": [2.0, 4.0]}, index=[0, 4]),
     )
-    assert len(metrics[unexpected_rows_metric.id].columns) == 3
-    pd.testing.assert_index_equal(metrics[unexpected_rows_metric.id].index, pd.Index([0, 4]))
 
     unexpected_values_metric = MetricConfiguration(
         metric_name=unexpected_values_metric_name,
@@ -6364,7 +5596,7 @@ def test_map_select_column_values_unique_within_record_sa(sa):  # noqa: PLR0915
     metrics.update(results)
 
     # Save original metrics for testing unexpected results.
-    metrics_save: dict = copy.deepcopy(metrics)
+    metrics_save: dict = dict(metrics)
 
     metric_name: str = "select_column_values.unique.within_record"
     condition_metric_name: str = (
@@ -6466,7 +5698,7 @@ def test_map_select_column_values_unique_within_record_sa(sa):  # noqa: PLR0915
     ]
 
     # Restore from saved original metrics in order to start fresh on testing for unexpected results.
-    metrics = copy.deepcopy(metrics_save)
+    metrics = dict(metrics_save)
 
     condition_metric = MetricConfiguration(
         metric_name=condition_metric_name,
@@ -6573,7 +5805,7 @@ def test_map_select_column_values_unique_within_record_spark(  # noqa: PLR0915 #
     metrics.update(results)
 
     # Save original metrics for testing unexpected results.
-    metrics_save: dict = copy.deepcopy(metrics)
+    metrics_save: dict = dict(metrics)
 
     metric_name: str = "select_column_values.unique.within_record"
     condition_metric_name: str = (
@@ -6683,7 +5915,7 @@ def test_map_select_column_values_unique_within_record_spark(  # noqa: PLR0915 #
     ]
 
     # Restore from saved original metrics in order to start fresh on testing for unexpected results.
-    metrics = copy.deepcopy(metrics_save)
+    metrics = dict(metrics_save)
 
     condition_metric = MetricConfiguration(
         metric_name=condition_metric_name,
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, cast
+import weakref
+from typing import Any, Dict, List, Tuple, cast
 
 import pandas as pd
 import pytest
@@ -50,13 +51,15 @@ from great_expectations.validator.validator import Validator
 logger = logging.getLogger(__name__)
 
 
-def get_table_columns_metric(
-    execution_engine: ExecutionEngine,
-) -> tuple[MetricConfiguration, dict]:
-    resolved_metrics: dict = {}
+# Resolved "table.columns" metrics per engine, keyed by active batch id.  The batch data object
+# is referenced weakly, since it holds its engine and would otherwise keep the key alive; checking
+# it by identity ensures that reloading data under the same batch id is never served stale schema.
+_TABLE_COLUMNS_METRIC_CACHE: weakref.WeakKeyDictionary[
+    ExecutionEngine, Dict[Any, Tuple[weakref.ref, dict]]
+] = weakref.WeakKeyDictionary()
 
-    results: dict
 
+def _build_table_columns_metric() -> tuple[MetricConfiguration, MetricConfiguration]:
     table_column_types_metric: MetricConfiguration = MetricConfiguration(
         metric_name="table.column_types",
         metric_domain_kwargs={},
@@ -64,8 +67,6 @@ def get_table_columns_metric(
             "include_nested": True,
         },
     )
-    results = execution_engine.resolve_metrics(metrics_to_resolve=(table_column_types_metric,))
-    resolved_metrics.update(results)
 
     table_columns_metric: MetricConfiguration = MetricConfiguration(
         metric_name="table.columns",
@@ -75,12 +76,40 @@ def get_table_columns_metric(
     table_columns_metric.metric_dependencies = {  # type: ignore[assignment]
         "table.column_types": table_column_types_metric,
     }
+
+    return table_column_types_metric, table_columns_metric
+
+
+def get_table_columns_metric(
+    execution_engine: ExecutionEngine,
+) -> tuple[MetricConfiguration, dict]:
+    table_column_types_metric: MetricConfiguration
+    table_columns_metric: MetricConfiguration
+    table_column_types_metric, table_columns_metric = _build_table_columns_metric()
+
+    batch_id = execution_engine.batch_manager.active_batch_id
+    batch_data = execution_engine.batch_manager.active_batch_data
+    cached_by_batch_id = _TABLE_COLUMNS_METRIC_CACHE.setdefault(execution_engine, {})
+    cached = cached_by_batch_id.get(batch_id)
+    if cached is not None and cached[0]() is batch_data:
+        return table_columns_metric, dict(cached[1])
+
+    resolved_metrics: dict = {}
+
+    results: dict
+
+    results = execution_engine.resolve_metrics(metrics_to_resolve=(table_column_types_metric,))
+    resolved_metrics.update(results)
+
     results = execution_engine.resolve_metrics(
         metrics_to_resolve=(table_columns_metric,), metrics=resolved_metrics
     )
     resolved_metrics.update(results)
 
-    return table_columns_metric, resolved_metrics
+    if batch_data is not None:
+        cached_by_batch_id[batch_id] = (weakref.ref(batch_data), resolved_metrics)
+
+    return table_columns_metric, dict(resolved_metrics)
 
 
 @pytest.fixture(scope="module")
@@ -7,7 +7,6 @@ import uuid
 from pprint import pformat as pf
 from typing import TYPE_CHECKING, Final, Iterator, Literal, Protocol
 
-import numpy as np
 import pytest
 
 import great_expectations as gx
@@ -20,6 +19,7 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.self_check.util import convert_pandas_df_to_spark_rows
 
 if TYPE_CHECKING:
     from great_expectations.checkpoint import Checkpoint
@@ -205,13 +205,7 @@ def spark_df_from_pandas_df():
         pandas_df,
     ):
         spark_df = spark_session.createDataFrame(
-            [
-                tuple(
-                    None if isinstance(x, (float, int)) and np.isnan(x) else x
-                    for x in record.tolist()
-                )
-                for record in pandas_df.to_records(index=False)
-            ],
+            convert_pandas_df_to_spark_rows(df=pandas_df),
             pandas_df.columns.tolist(),
         )
         return spark_df
@@ -1,4 +1,3 @@
-import logging
 from typing import Any, Dict, List
 
 import pytest
@@ -7,17 +6,7 @@ from packaging.version import parse as parse_version
 
 from great_expectations.compatibility import pyspark
 from great_expectations.datasource.fluent import SparkDatasource
-
-logger = logging.getLogger(__name__)
-
-try:
-    from great_expectations.execution_engine import SparkDFExecutionEngine
-except ImportError:
-    SparkDFExecutionEngine = None
-    # TODO: review logging more detail here
-    logger.debug(
-        "Unable to load pyspark; install optional spark dependency if you will be working with Spark dataframes."  # noqa: E501
-    )
+from great_expectations.execution_engine import SparkDFExecutionEngine
 
 # module level markers
 pytestmark = pytest.mark.spark
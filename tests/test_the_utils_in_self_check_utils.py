@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from contextlib import nullcontext as does_not_raise
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from great_expectations.exceptions import ExecutionEngineError
 from great_expectations.self_check.util import (
     _check_if_valid_dataset_name,
+    convert_pandas_df_to_spark_rows,
     generate_dataset_name_from_expectation_name,
 )
 
@@ -134,3 +137,21 @@ def test_check_if_valid_dataset_name(dataset_name: str, expected_output: str, ex
             )
             == expected_output
         )
+
+
+def test_convert_pandas_df_to_spark_rows():
+    """NaN becomes None in both float and object columns; other values become native Python types"""
+    df = pd.DataFrame(
+        {
+            "int": [1, 2],
+            "float": [1.5, np.nan],
+            "str": ["a", None],
+            "mixed": [np.nan, "b"],
+            "bool": [True, False],
+        }
+    )
+
+    rows = convert_pandas_df_to_spark_rows(df=df)
+
+    assert rows == [(1, 1.5, "a", None, True), (2, None, None, "b", False)]
+    assert [type(value) for value in rows[0]] == [int, float, str, type(None), bool]